@@ -0,0 +1,55 @@
+"""A small in-process cache for pre-serialized responses.
+
+Entries expire after a fixed time-to-live. The cache is local to one worker
+process, so with several workers a change may take up to the TTL to be
+visible in all of them.
+"""
+
+import threading
+import time
+from collections.abc import Callable
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class TTLCache(Generic[T]):
+    """Thread-safe key/value cache whose entries expire after `ttl` seconds."""
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self._entries: dict[str, tuple[float, T]] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get_or_set(self, key: str, factory: Callable[[], T]) -> T:
+        """Returns the cached value for `key`, computing it with `factory` on a miss.
+
+        The factory runs without holding the lock. If the cache is cleared
+        while it runs, the computed value is returned but not stored, so an
+        invalidation is never overwritten by data read before it.
+
+        Args:
+            key: The cache key.
+            factory: Callable that produces the value on a miss.
+
+        Returns:
+            The cached or freshly computed value.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                return entry[1]
+            generation = self._generation
+        value = factory()
+        with self._lock:
+            if generation == self._generation:
+                self._entries[key] = (time.monotonic() + self.ttl, value)
+        return value
+
+    def clear(self) -> None:
+        """Drops every entry, e.g. after the underlying data changed."""
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
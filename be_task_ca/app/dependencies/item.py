@@ -1,85 +1,83 @@
 """Module for defining dependency injectors for item-related operations.
 
 These functions are used by FastAPI's dependency injection system to provide
-instances of use cases and database sessions to the API route handlers.
-They handle the creation of necessary repositories, injecting
-database sessions where needed.
+instances of use cases to the API route handlers.
+
+Repositories and use cases are stateless apart from their collaborators, so
+they are built once per process instead of on every request. The SQLAlchemy
+repository is bound to the `ScopedSession` proxy, which resolves to the
+current request's session on each call.
 """
 
-import os
-from collections.abc import Iterator
+from functools import lru_cache
 
-from fastapi import Request
+from fastapi import Depends
 
+from be_task_ca.config import settings
 from be_task_ca.domain.item.usecases import CreateItemUseCase, GetAllItemsUseCase
-from be_task_ca.infra.database import SessionLocal
+from be_task_ca.infra.database import ScopedSession
 from be_task_ca.infra.item.in_memory_repository import InMemoryItemRepository
 from be_task_ca.infra.item.sqlalchemy_repository import SQLAlchemyItemRepository
 from be_task_ca.interfaces.item import ItemRepository
 
 
-def get_db(request: Request) -> Iterator:  # noqa: ARG001
-    """Provides a database session as a context-managed generator.
-
-    This function creates a new SQLAlchemy session for a request and ensures
-    it's closed afterwards. It's designed to be used as a generator,
-    typically with `next()` to retrieve the session.
-
-    Args:
-        request: The request object. Currently unused but included for
-        consistency with dependency patterns.
+def _create_item_repository() -> ItemRepository:
+    """Builds the ItemRepository selected by REPOSITORY_TYPE at startup.
 
-    Yields:
-        sqlalchemy.orm.Session: The database session.
+    Returns:
+        An InMemoryItemRepository if REPOSITORY_TYPE is 'in_memory', otherwise
+        a SQLAlchemyItemRepository bound to the request-scoped session.
     """
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+    if settings.repository_type == "in_memory":
+        return InMemoryItemRepository()
+    return SQLAlchemyItemRepository(ScopedSession)
 
 
-def get_item_repository(request: Request) -> ItemRepository:
-    """Returns the appropriate ItemRepository based on environment configuration.
+# Built once and shared by all requests, so the in-memory store keeps its data
+# between requests.
+_item_repository = _create_item_repository()
 
-    Uses InMemoryItemRepository if REPOSITORY_TYPE is set to 'in_memory', otherwise
-    uses SQLAlchemyItemRepository.
 
-    Args:
-        request: The request object, used to get a database session.
+def get_item_repository() -> ItemRepository:
+    """Returns the process-wide ItemRepository.
 
     Returns:
         An instance of ItemRepository.
     """
-    repository_type = os.getenv("REPOSITORY_TYPE", "sqlalchemy")
-    if repository_type == "in_memory":
-        return InMemoryItemRepository()
-    return SQLAlchemyItemRepository(next(get_db(request)))
+    return _item_repository
 
 
-def get_create_item_use_case(request: Request) -> CreateItemUseCase:
+@lru_cache(maxsize=1)
+def get_create_item_use_case(
+    item_repository: ItemRepository = Depends(get_item_repository),
+) -> CreateItemUseCase:
     """Dependency to get an instance of CreateItemUseCase.
 
-    Initializes the use case with an ItemRepository, either in-memory or SQLAlchemy-based.
+    The instance is cached for the resolved repository, so it is built only
+    once unless the repository dependency is overridden.
 
     Args:
-        request: The request object, used to get a database session.
+        item_repository: The repository resolved by `get_item_repository`.
 
     Returns:
         An instance of CreateItemUseCase.
     """
-    return CreateItemUseCase(get_item_repository(request))
+    return CreateItemUseCase(item_repository)
 
 
-def get_all_items_use_case(request: Request) -> GetAllItemsUseCase:
+@lru_cache(maxsize=1)
+def get_all_items_use_case(
+    item_repository: ItemRepository = Depends(get_item_repository),
+) -> GetAllItemsUseCase:
     """Dependency to get an instance of GetAllItemsUseCase.
 
-    Initializes the use case with an ItemRepository, either in-memory or SQLAlchemy-based.
+    The instance is cached for the resolved repository, so it is built only
+    once unless the repository dependency is overridden.
 
     Args:
-        request: The request object, used to get a database session.
+        item_repository: The repository resolved by `get_item_repository`.
 
     Returns:
         An instance of GetAllItemsUseCase.
     """
-    return GetAllItemsUseCase(get_item_repository(request))
+    return GetAllItemsUseCase(item_repository)
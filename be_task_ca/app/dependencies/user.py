@@ -1,101 +1,130 @@
 """Module for defining dependency injectors for user-related operations.
 
 These functions are used by FastAPI's dependency injection system to provide
-instances of use cases and database sessions to the API route handlers.
-They handle the creation of necessary repositories and services, injecting
-database sessions where needed.
+instances of use cases to the API route handlers.
+
+Repositories, services and use cases are stateless apart from their
+collaborators, so they are built once per process instead of on every request.
+The SQLAlchemy repository is bound to the `ScopedSession` proxy, which resolves
+to the current request's session on each call.
 """
 
-import os
-from collections.abc import Iterator
+from functools import lru_cache
 
-from fastapi import Request
+from fastapi import Depends
 
+from be_task_ca.config import settings
 from be_task_ca.domain.user.usecases import (
     AddItemToCartUseCase,
     CreateUserUseCase,
     ListItemsInCartUseCase,
 )
-from be_task_ca.infra.database import SessionLocal
+from be_task_ca.infra.database import ScopedSession
+from be_task_ca.infra.user.cached_item_service import CachedItemService
 from be_task_ca.infra.user.in_memory_repository import InMemoryUserRepository
 from be_task_ca.infra.user.item_service import MockItemService
 from be_task_ca.infra.user.sqlalchemy_repository import SQLAlchemyUserRepository
-from be_task_ca.interfaces.user import UserRepository
+from be_task_ca.interfaces.user import ItemService, UserRepository
+
 
+def _create_user_repository() -> UserRepository:
+    """Builds the UserRepository selected by REPOSITORY_TYPE at startup.
 
-def get_db(request: Request) -> Iterator:  # noqa: ARG001
-    """Provides a database session as a context-managed generator.
+    Returns:
+        An InMemoryUserRepository if REPOSITORY_TYPE is 'in_memory', otherwise
+        a SQLAlchemyUserRepository bound to the request-scoped session.
+    """
+    if settings.repository_type == "in_memory":
+        return InMemoryUserRepository()
+    return SQLAlchemyUserRepository(ScopedSession)
 
-    This function creates a new SQLAlchemy session for a request and ensures
-    it's closed afterwards. It's designed to be used as a generator,
-    typically with `next()` to retrieve the session.
 
-    Args:
-        request: The request object. Currently unused but included
-                 for consistency with dependency patterns.
+# Built once and shared by all requests, so the in-memory store keeps its data
+# between requests.
+_user_repository = _create_user_repository()
 
-    Yields:
-        sqlalchemy.orm.Session: The database session.
-    """
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+# One instance serves every request, so its lookup cache is shared by all of them.
+_item_service: ItemService = MockItemService()
+if settings.item_service_cache_ttl > 0:
+    _item_service = CachedItemService(
+        _item_service, ttl=settings.item_service_cache_ttl
+    )
 
 
-def get_user_repository(request: Request) -> UserRepository:
-    """Returns the appropriate UserRepository based on environment configuration.
+def get_user_repository() -> UserRepository:
+    """Returns the process-wide UserRepository.
 
-    Uses InMemoryUserRepository if REPOSITORY_TYPE is set to 'in_memory', otherwise
-    uses SQLAlchemyUserRepository.
+    Returns:
+        An instance of UserRepository.
     """
-    repository_type = os.getenv("REPOSITORY_TYPE", "sqlalchemy")
-    if repository_type == "in_memory":
-        return InMemoryUserRepository()
-    return SQLAlchemyUserRepository(next(get_db(request)))
+    return _user_repository
 
 
-def get_create_user_use_case(request: Request) -> CreateUserUseCase:
+@lru_cache(maxsize=1)
+def get_create_user_use_case(
+    user_repository: UserRepository = Depends(get_user_repository),
+) -> CreateUserUseCase:
     """Dependency to get an instance of CreateUserUseCase.
 
-    Initializes the use case with a SQLAlchemyUserRepository, providing it
-    with a database session obtained via the `get_db` generator.
+    The instance is cached for the resolved repository, so it is built only
+    once unless the repository dependency is overridden.
 
     Args:
-        request: The request object, used to get a database session.
+        user_repository: The repository resolved by `get_user_repository`.
 
     Returns:
         An instance of CreateUserUseCase.
     """
-    return CreateUserUseCase(get_user_repository(request))
+    return CreateUserUseCase(user_repository)
+
+
+def get_item_service() -> ItemService:
+    """Dependency to get the ItemService used by cart operations.
+
+    Declared as its own dependency, separate from the repository chain, so it
+    can be overridden or swapped for a real client without touching the
+    repository dependency. A single process-wide instance is returned.
+
+    Returns:
+        An instance of ItemService.
+    """
+    return _item_service
 
 
-def get_add_item_to_cart_use_case(request: Request) -> AddItemToCartUseCase:
+@lru_cache(maxsize=1)
+def get_add_item_to_cart_use_case(
+    user_repository: UserRepository = Depends(get_user_repository),
+    item_service: ItemService = Depends(get_item_service),
+) -> AddItemToCartUseCase:
     """Dependency to get an instance of AddItemToCartUseCase.
 
-    Initializes the use case with a SQLAlchemyUserRepository (which gets a
-    database session via `get_db`) and a MockItemService.
+    Initializes the use case with the UserRepository and the ItemService from
+    `get_item_service`. The instance is cached for those collaborators, so it
+    is built only once unless a dependency is overridden.
 
     Args:
-        request: The request object, used to get a database session.
+        user_repository: The repository resolved by `get_user_repository`.
+        item_service: The service resolved by `get_item_service`.
 
     Returns:
         An instance of AddItemToCartUseCase.
     """
-    return AddItemToCartUseCase(get_user_repository(request), MockItemService())
+    return AddItemToCartUseCase(user_repository, item_service)
 
 
-def get_list_all_items_in_cart_use_case(request: Request) -> ListItemsInCartUseCase:
+@lru_cache(maxsize=1)
+def get_list_all_items_in_cart_use_case(
+    user_repository: UserRepository = Depends(get_user_repository),
+) -> ListItemsInCartUseCase:
     """Dependency to get an instance of ListItemsInCartUseCase.
 
-    Initializes the use case with a SQLAlchemyUserRepository, providing it
-    with a database session obtained via the `get_db` generator.
+    The instance is cached for the resolved repository, so it is built only
+    once unless the repository dependency is overridden.
 
     Args:
-        request: The request object, used to get a database session.
+        user_repository: The repository resolved by `get_user_repository`.
 
     Returns:
         An instance of ListItemsInCartUseCase.
     """
-    return ListItemsInCartUseCase(get_user_repository(request))
+    return ListItemsInCartUseCase(user_repository)
@@ -0,0 +1,32 @@
+"""ASGI middleware for the application.
+
+`SessionMiddleware` opens a request scope in which a single SQLAlchemy session
+is shared by every dependency that asks for one. The session is created
+lazily on first use by `ScopedSession` and removed once the response has been
+sent. It's written as a plain ASGI callable rather than on top of
+`BaseHTTPMiddleware` to avoid the extra task and stream wrapping that class
+adds to every request.
+"""
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from be_task_ca.infra.database import ScopedSession, request_scope
+
+
+class SessionMiddleware:
+    """Pure ASGI middleware that scopes one database session to each request."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Runs the wrapped app inside a fresh request scope for HTTP requests."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        token = request_scope.set(id(scope))
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            ScopedSession.remove()
+            request_scope.reset(token)
@@ -0,0 +1,95 @@
+"""Helpers for building HTTP responses from response schemas.
+
+FastAPI re-validates a handler's return value against its `response_model`
+and then walks it with `jsonable_encoder` before serializing. Use cases
+already return instances of the response schemas, so handlers serialize them
+directly and return a ready `Response`, which FastAPI passes through untouched.
+The `response_model` declared on each route is still used for the OpenAPI schema.
+"""
+
+from collections.abc import Iterable, Iterator
+
+from fastapi import Response, status
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel
+
+
+def json_response(
+    model: BaseModel,
+    status_code: int = status.HTTP_200_OK,
+    exclude_none: bool = False,
+) -> Response:
+    """Serializes a response schema instance into a JSON response.
+
+    Args:
+        model: The response schema instance to serialize.
+        status_code: The HTTP status code of the response.
+        exclude_none: Whether to leave out fields whose value is None, the
+            counterpart of a route's `response_model_exclude_none`.
+
+    Returns:
+        A response whose body is the JSON representation of `model`.
+    """
+    return Response(
+        content=model.json(exclude_none=exclude_none),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
+def error_response(detail: str, status_code: int) -> Response:
+    """Builds an error response with the same body as `HTTPException`.
+
+    Returning this from a handler avoids raising through Starlette's
+    exception middleware for expected, frequent errors such as conflicts.
+
+    Args:
+        detail: The error message.
+        status_code: The HTTP status code of the response.
+
+    Returns:
+        A JSON response of the form `{"detail": detail}`.
+    """
+    return JSONResponse({"detail": detail}, status_code=status_code)
+
+
+def _stream_json_list(key: str, models: Iterable[BaseModel]) -> Iterator[bytes]:
+    """Yields the JSON encoding of `{key: [*models]}` one element at a time."""
+    yield b'{"' + key.encode() + b'":['
+    separator = b""
+    for model in models:
+        yield separator + model.json().encode()
+        separator = b","
+    yield b"]}"
+
+
+def json_list_body(key: str, models: Iterable[BaseModel]) -> bytes:
+    """Serializes `{key: [*models]}` into a single JSON body.
+
+    Args:
+        key: The name of the list field in the JSON object.
+        models: The response schema instances making up the list.
+
+    Returns:
+        The JSON body as bytes.
+    """
+    return b"".join(_stream_json_list(key, models))
+
+
+def streaming_json_list_response(key: str, models: Iterable[BaseModel]) -> Response:
+    """Streams a JSON object holding a single list of response schemas.
+
+    The body has the same shape as a schema with one list field named `key`,
+    but each element is serialized and sent as soon as it is produced, so the
+    full list is never materialized.
+
+    Args:
+        key: The name of the list field in the JSON object.
+        models: The response schema instances making up the list.
+
+    Returns:
+        A streaming response with a JSON body.
+    """
+    return StreamingResponse(
+        _stream_json_list(key, models), media_type="application/json"
+    )
@@ -0,0 +1,86 @@
+"""Route definitions for item operations.
+
+The router is mounted by `be_task_ca.app.main`, which is the application's
+only ASGI entry point. Handlers whose use cases are synchronous (and so block
+on database I/O) are declared with plain `def`, which makes FastAPI run them
+in its threadpool instead of on the event loop.
+"""
+
+from fastapi import APIRouter, Depends, Response, status
+
+from be_task_ca.app.cache import TTLCache
+from be_task_ca.app.dependencies.item import (
+    get_all_items_use_case,
+    get_create_item_use_case,
+)
+from be_task_ca.app.responses import (
+    error_response,
+    json_list_body,
+    json_response,
+    streaming_json_list_response,
+)
+from be_task_ca.config import settings
+from be_task_ca.domain.item.schema import (
+    AllItemsResponse,
+    CreateItemRequest,
+    CreateItemResponse,
+)
+from be_task_ca.domain.item.usecases import CreateItemUseCase, GetAllItemsUseCase
+
+item_router = APIRouter(prefix="/items", tags=["item"])
+
+# Serialized item listing, shared by all requests of this process.
+_items_cache: TTLCache[bytes] = TTLCache(ttl=settings.items_cache_ttl)
+_ALL_ITEMS_KEY = "all"
+
+
+@item_router.post("/", response_model=CreateItemResponse)
+def post_item(
+    item: CreateItemRequest,
+    use_case: CreateItemUseCase = Depends(get_create_item_use_case),
+) -> Response:
+    """Creates a new item.
+
+    Args:
+        item: The item data from the request body.
+        use_case: The dependency-injected use case for creating an item.
+
+    Returns:
+        The created item's details, or a 409 Conflict response if an item with
+        the given name already exists or if there's a validation error (e.g.,
+        negative price).
+    """
+    try:
+        response = use_case.execute(item)
+    except ValueError as e:
+        # Assuming ValueError from use_case indicates a duplicate name or validation issue
+        return error_response(str(e), status.HTTP_409_CONFLICT)
+    _items_cache.clear()
+    return json_response(response)
+
+
+@item_router.get("/", response_model=AllItemsResponse)
+def get_items(
+    use_case: GetAllItemsUseCase = Depends(get_all_items_use_case),
+) -> Response:
+    """Retrieves all available items.
+
+    By default the listing is streamed as it is read from the repository, so
+    memory use stays flat however large the catalog grows. Setting
+    `ITEMS_CACHE_TTL` caches the serialized listing for that many seconds,
+    invalidated whenever an item is created. That skips the query on hits but
+    holds the whole catalog in memory as one body, so it only suits catalogs
+    small enough to keep resident.
+
+    Args:
+        use_case: The dependency-injected use case for getting all items.
+
+    Returns:
+        A list of all items.
+    """
+    if not settings.items_cache_ttl:
+        return streaming_json_list_response("items", use_case.stream())
+    body = _items_cache.get_or_set(
+        _ALL_ITEMS_KEY, lambda: json_list_body("items", use_case.stream())
+    )
+    return Response(content=body, media_type="application/json")
@@ -0,0 +1,126 @@
+"""Route definitions for user and cart operations.
+
+The router is mounted by `be_task_ca.app.main`, which is the application's
+only ASGI entry point. Handlers whose use cases are synchronous (and so block
+on database I/O) are declared with plain `def`, which makes FastAPI run them
+in its threadpool instead of on the event loop.
+"""
+
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Response, status
+
+from be_task_ca.app.dependencies.user import (
+    get_add_item_to_cart_use_case,
+    get_create_user_use_case,
+    get_list_all_items_in_cart_use_case,
+)
+from be_task_ca.app.responses import error_response, json_response
+from be_task_ca.domain.user.schema import (
+    AddToCartRequest,
+    AddToCartResponse,
+    CreateUserRequest,
+    CreateUserResponse,
+)
+from be_task_ca.domain.user.usecases import (
+    AddItemToCartUseCase,
+    CreateUserUseCase,
+    InsufficientStockError,
+    ItemAlreadyInCartError,
+    ItemNotFoundError,
+    ListItemsInCartUseCase,
+    UserAlreadyExistsError,
+    UserNotFoundError,
+)
+
+user_router = APIRouter(prefix="/users", tags=["user"])
+
+# Status code for each use-case error; other ValueErrors are conflicts.
+_ERROR_STATUS: dict[type[ValueError], int] = {
+    UserAlreadyExistsError: status.HTTP_409_CONFLICT,
+    UserNotFoundError: status.HTTP_404_NOT_FOUND,
+    ItemNotFoundError: status.HTTP_404_NOT_FOUND,
+    InsufficientStockError: status.HTTP_422_UNPROCESSABLE_ENTITY,
+    ItemAlreadyInCartError: status.HTTP_409_CONFLICT,
+}
+
+
+def _error_status(error: ValueError) -> int:
+    """Returns the HTTP status code for an error raised by a use case."""
+    return _ERROR_STATUS.get(type(error), status.HTTP_409_CONFLICT)
+
+
+@user_router.post(
+    "/", response_model=CreateUserResponse, response_model_exclude_none=True
+)
+def post_customer(
+    user: CreateUserRequest,
+    use_case: CreateUserUseCase = Depends(get_create_user_use_case),
+) -> Response:
+    """Creates a new user.
+
+    Args:
+        user: The user data from the request body.
+        use_case: The dependency-injected use case for creating a user.
+
+    Returns:
+        The created user's details, without a `shipping_address` key when it
+        is unset, or a 409 Conflict response if a user with the given email
+        already exists.
+    """
+    try:
+        response = use_case.execute(user)
+    except ValueError as e:
+        return error_response(str(e), _error_status(e))
+    return json_response(response, exclude_none=True)
+
+
+@user_router.post(
+    "/{user_id}/cart",
+    response_model=AddToCartResponse,
+    response_model_exclude_none=True,
+)
+async def post_cart(
+    user_id: UUID,
+    cart_item: AddToCartRequest,
+    use_case: AddItemToCartUseCase = Depends(get_add_item_to_cart_use_case),
+) -> Response:
+    """Adds an item to a specified user's shopping cart.
+
+    Args:
+        user_id: The ID of the user whose cart is being modified.
+        cart_item: The item and quantity to add to the cart.
+        use_case: The dependency-injected use case for adding an item to a cart.
+
+    Returns:
+        The updated cart contents, a 404 Not Found response if the user or
+        item does not exist, a 422 Unprocessable Entity response if there is
+        not enough stock, or a 409 Conflict response if the item is already
+        in the cart.
+    """
+    try:
+        response = await use_case.execute(user_id, cart_item)
+    except ValueError as e:
+        return error_response(str(e), _error_status(e))
+    return json_response(response, exclude_none=True)
+
+
+@user_router.get(
+    "/{user_id}/cart",
+    response_model=AddToCartResponse,
+    response_model_exclude_none=True,
+)
+def get_cart(
+    user_id: UUID,
+    use_case: ListItemsInCartUseCase = Depends(get_list_all_items_in_cart_use_case),
+) -> Response:
+    """Retrieves all items in a specified user's shopping cart.
+
+    Args:
+        user_id: The ID of the user whose cart is being retrieved.
+        use_case: The dependency-injected use case for listing cart items.
+
+    Returns:
+        The contents of the user's cart.
+    """
+    return json_response(use_case.execute(user_id), exclude_none=True)
@@ -3,6 +3,9 @@
 These entities are simple data classes representing the structure of
 item-related data within the application, independent of the database
 or API layers.
+
+Prices are held as an integer number of cents, which is exact and cheaper to
+load and copy than `Decimal`; `Decimal` is only used at the API boundary.
 """
 
 from dataclasses import dataclass
@@ -10,19 +13,41 @@ from decimal import Decimal
 from uuid import UUID
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Item:
-    """Represents an item in the inventory or catalog."""
+    """Represents an item in the inventory or catalog.
+
+    Items are immutable, so repositories can hold on to the instances they are
+    given without defensive copies. Use `dataclasses.replace` to derive a
+    modified item.
+    """
 
     id: UUID
     name: str
     description: str | None
-    price: Decimal
+    price_cents: int
     quantity: int
 
     def __post_init__(self) -> None:
-        if self.price < Decimal("0"):
+        if self.price_cents < 0:
             raise ValueError("Price cannot be negative")
 
         if self.quantity < 0:
             raise ValueError("Quantity cannot be negative")
+
+    @property
+    def price(self) -> Decimal:
+        """The price in currency units, e.g. `Decimal("19.99")`."""
+        return Decimal(self.price_cents).scaleb(-2)
+
+
+def price_to_cents(price: Decimal) -> int:
+    """Converts a price in currency units into an integer number of cents.
+
+    Args:
+        price: The price, with at most two decimal places.
+
+    Returns:
+        The price in cents.
+    """
+    return int(price.scaleb(2))
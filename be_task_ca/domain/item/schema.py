@@ -5,10 +5,9 @@ in FastAPI applications. These schemas ensure that data exchanged with the
 item API endpoints conforms to the expected structure and types.
 """
 
-from decimal import Decimal
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, condecimal
 
 
 class CreateItemRequest(BaseModel):
@@ -16,7 +15,8 @@ class CreateItemRequest(BaseModel):
 
     name: str
     description: str | None = None
-    price: Decimal
+    # Stored as whole cents, so finer-grained prices are rejected.
+    price: condecimal(decimal_places=2)  # type: ignore
     quantity: int
 
 
@@ -6,9 +6,10 @@ specific outcomes. They are typically called by API handlers or other
 service layers.
 """
 
+from collections.abc import Iterator
 from uuid import uuid4
 
-from be_task_ca.domain.item.entities import Item
+from be_task_ca.domain.item.entities import Item, price_to_cents
 from be_task_ca.domain.item.schema import (
     AllItemsResponse,
     CreateItemRequest,
@@ -20,9 +21,8 @@ from be_task_ca.interfaces.item import ItemRepository
 class CreateItemUseCase:
     """Use case for creating a new item.
 
-    This class handles the business logic required to create an item,
-    including checking for duplicates by name and persisting the new item
-    via the item repository.
+    This class handles the business logic required to create an item and
+    persist it via the item repository, which rejects duplicate names.
     """
 
     def __init__(self, item_repository: ItemRepository) -> None:
@@ -31,10 +31,10 @@ class CreateItemUseCase:
     def execute(self, request: CreateItemRequest) -> CreateItemResponse:
         """Executes the item creation process.
 
-        It first checks if an item with the given name already exists. If so,
-        it raises a ValueError. Otherwise, it creates a new Item entity,
-        assigns a new UUID, saves it using the repository, and then returns
-        the details of the created item.
+        It creates a new Item entity, assigns a new UUID, saves it using the
+        repository, and then returns the details of the created item. Name
+        uniqueness is enforced by the repository as part of the save, so a
+        concurrent create with the same name cannot slip past a separate check.
 
         Args:
             request: A CreateItemRequest object containing the data for the new item.
@@ -46,14 +46,11 @@ class CreateItemUseCase:
             A CreateItemResponse object with the details of the newly created item,
             including its generated ID.
         """
-        if self.item_repository.find_by_name(request.name):
-            raise ValueError("An item with this name already exists")
-
         item = Item(
             id=uuid4(),
             name=request.name,
             description=request.description,
-            price=request.price,
+            price_cents=price_to_cents(request.price),
             quantity=request.quantity,
         )
         saved_item = self.item_repository.save(item)
@@ -81,21 +78,30 @@ class GetAllItemsUseCase:
         """Executes the process of retrieving all items.
 
         Fetches all items from the repository and formats them into an AllItemsResponse.
+        The response models are built without validation since the data comes
+        from Item entities that were validated on creation.
 
         Returns:
             An AllItemsResponse object containing a list of all items, where each item
             is represented as a CreateItemResponse.
         """
-        items = self.item_repository.get_all()
-        return AllItemsResponse(
-            items=[
-                CreateItemResponse(
-                    id=item.id,
-                    name=item.name,
-                    description=item.description,
-                    price=item.price,
-                    quantity=item.quantity,
-                )
-                for item in items
-            ]
-        )
+        return AllItemsResponse.construct(items=list(self.stream()))
+
+    def stream(self) -> Iterator[CreateItemResponse]:
+        """Yields every item as a CreateItemResponse, one at a time.
+
+        Unlike `execute`, the full result set is never held in memory, which
+        lets callers start sending a response before all rows are fetched.
+
+        Yields:
+            A CreateItemResponse for each stored item.
+        """
+        # Items already enforce their invariants, so skip per-field validation.
+        for item in self.item_repository.get_all():
+            yield CreateItemResponse.construct(
+                id=item.id,
+                name=item.name,
+                description=item.description,
+                price=item.price,
+                quantity=item.quantity,
+            )
@@ -5,13 +5,16 @@ user-related data within the application, independent of the database
 or API layers.
 """
 
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass, field
 from uuid import UUID
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CartItem:
-    """Represents an item within a user's shopping cart."""
+    """Represents an item within a user's shopping cart.
+
+    Cart items are immutable, so carts can share them without copying.
+    """
 
     user_id: UUID
     item_id: UUID
@@ -27,12 +30,21 @@ class CartItem:
         Returns:
             A dictionary representation of the CartItem instance.
         """
-        return asdict(self)
+        return {
+            "user_id": self.user_id,
+            "item_id": self.item_id,
+            "quantity": self.quantity,
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
-    """Represents a user in the system."""
+    """Represents a user in the system.
+
+    The ids of the items in the cart are indexed in a set so membership checks
+    do not scan the cart. Add cart items through `add_cart_item` to keep that
+    index in sync.
+    """
 
     id: UUID
     email: str
@@ -41,11 +53,46 @@ class User:
     hashed_password: str
     shipping_address: str | None
     cart_items: list["CartItem"]
+    _cart_item_ids: set[UUID] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._cart_item_ids = {cart_item.item_id for cart_item in self.cart_items}
+
+    def has_cart_item(self, item_id: UUID) -> bool:
+        """Checks whether an item is already in the user's cart.
+
+        Args:
+            item_id: The UUID of the item to look for.
+
+        Returns:
+            True if the cart contains the item, False otherwise.
+        """
+        return item_id in self._cart_item_ids
+
+    def add_cart_item(self, cart_item: CartItem) -> None:
+        """Appends an item to the user's cart.
+
+        Args:
+            cart_item: The CartItem to add.
+        """
+        self.cart_items.append(cart_item)
+        self._cart_item_ids.add(cart_item.item_id)
 
     def model_dump(self) -> dict:
         """Converts the User dataclass instance to a dictionary.
 
+        Cart items are dumped as nested dictionaries. Field values are not
+        copied, unlike `dataclasses.asdict`, which deep-copies every field.
+
         Returns:
             A dictionary representation of the User instance.
         """
-        return asdict(self)
+        return {
+            "id": self.id,
+            "email": self.email,
+            "first_name": self.first_name,
+            "last_name": self.last_name,
+            "hashed_password": self.hashed_password,
+            "shipping_address": self.shipping_address,
+            "cart_items": [cart_item.model_dump() for cart_item in self.cart_items],
+        }
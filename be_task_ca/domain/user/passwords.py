@@ -0,0 +1,82 @@
+"""This module provides password hashing for the user domain.
+
+New passwords are hashed with salted scrypt from `hashlib`, which runs in
+OpenSSL's native code. scrypt is memory-hard, so at the chosen cost (about
+16 MiB and a few tens of milliseconds per hash) it resists GPU attacks better
+than iterated SHA while staying cheap in CPU time per request.
+
+The encoded hash keeps the algorithm, cost parameters and salt next to the
+digest, so the work factor can be raised later without invalidating stored
+hashes.
+"""
+
+import base64
+import hashlib
+import hmac
+import secrets
+
+ALGORITHM = "scrypt"
+SCRYPT_N = 2**14
+SCRYPT_R = 8
+SCRYPT_P = 1
+SALT_SIZE = 16
+DIGEST_SIZE = 64
+
+# Upper bound for scrypt's working memory (128 * n * r bytes), with headroom.
+_SCRYPT_MAXMEM = 64 * 1024 * 1024
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.b64encode(data).decode("ascii").rstrip("=")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.b64decode(data + "=" * (-len(data) % 4))
+
+
+def _scrypt(password: str, salt: bytes, n: int, r: int, p: int) -> bytes:
+    return hashlib.scrypt(
+        password.encode("utf-8"),
+        salt=salt,
+        n=n,
+        r=r,
+        p=p,
+        maxmem=_SCRYPT_MAXMEM,
+        dklen=DIGEST_SIZE,
+    )
+
+
+def hash_password(password: str) -> str:
+    """Hashes a password with a fresh random salt.
+
+    Args:
+        password: The plain-text password.
+
+    Returns:
+        The encoded hash, in the form `scrypt$n,r,p$salt$digest`.
+    """
+    salt = secrets.token_bytes(SALT_SIZE)
+    digest = _scrypt(password, salt, SCRYPT_N, SCRYPT_R, SCRYPT_P)
+    parameters = f"{SCRYPT_N},{SCRYPT_R},{SCRYPT_P}"
+    return f"{ALGORITHM}${parameters}${_b64encode(salt)}${_b64encode(digest)}"
+
+
+def verify_password(password: str, hashed_password: str) -> bool:
+    """Checks a password against a hash produced by `hash_password`.
+
+    Args:
+        password: The plain-text password to check.
+        hashed_password: The encoded hash to check against.
+
+    Returns:
+        True if the password matches, False otherwise.
+    """
+    try:
+        algorithm, parameters, salt, digest = hashed_password.split("$")
+        if algorithm != ALGORITHM:
+            return False
+        n, r, p = (int(value) for value in parameters.split(","))
+        expected = _scrypt(password, _b64decode(salt), n, r, p)
+    except ValueError:
+        return False
+    return hmac.compare_digest(expected, _b64decode(digest))
@@ -6,17 +6,20 @@ of the API endpoints concerning users and their shopping carts.
 
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+# A deliberately loose shape check; email-validator is not a dependency.
+EMAIL_PATTERN = r"^[^@\s]+@[^@\s]+\.[^@\s]+$"
 
 
 class CreateUserRequest(BaseModel):
     """Schema for the request body when creating a new user."""
 
-    first_name: str
-    last_name: str
-    email: str
-    password: str
-    shipping_address: str | None
+    first_name: str = Field(max_length=64)
+    last_name: str = Field(max_length=64)
+    email: str = Field(max_length=254, regex=EMAIL_PATTERN)
+    password: str = Field(min_length=8, max_length=128)
+    shipping_address: str | None = Field(default=None, max_length=256)
 
 
 class CreateUserResponse(BaseModel):
@@ -5,10 +5,12 @@ interactions between entities, repositories, and other services to achieve
 specific outcomes related to users and their carts.
 """
 
-import hashlib
+import asyncio
+from collections.abc import Iterable
 from uuid import UUID, uuid4
 
 from be_task_ca.domain.user.entities import CartItem, User
+from be_task_ca.domain.user.passwords import hash_password
 from be_task_ca.domain.user.schema import (
     AddToCartRequest,
     AddToCartResponse,
@@ -18,6 +20,42 @@ from be_task_ca.domain.user.schema import (
 from be_task_ca.interfaces.user import ItemService, UserRepository
 
 
+class UserAlreadyExistsError(ValueError):
+    """Raised when a user with the requested email already exists."""
+
+
+class UserNotFoundError(ValueError):
+    """Raised when the referenced user does not exist."""
+
+
+class ItemNotFoundError(ValueError):
+    """Raised when the referenced item does not exist."""
+
+
+class InsufficientStockError(ValueError):
+    """Raised when an item does not have enough stock for the request."""
+
+
+class ItemAlreadyInCartError(ValueError):
+    """Raised when the item is already present in the user's cart."""
+
+
+def _to_cart_response(cart_items: Iterable[CartItem]) -> AddToCartResponse:
+    """Builds the cart response without re-validating the cart items.
+
+    CartItem entities already enforce their invariants, so the Pydantic
+    models are built with `construct`, skipping per-field validation.
+    """
+    return AddToCartResponse.construct(
+        items=[
+            AddToCartRequest.construct(
+                item_id=cart_item.item_id, quantity=cart_item.quantity
+            )
+            for cart_item in cart_items
+        ]
+    )
+
+
 class CreateUserUseCase:
     """Use case for creating a new user.
 
@@ -33,33 +71,40 @@ class CreateUserUseCase:
         """Executes the user creation process.
 
         Checks if a user with the given email already exists. If not,
-        it creates a new User entity, hashes the password, saves it
+        it creates a new User entity, hashes the password with a salted
+        key-derivation function (see `passwords.hash_password`), saves it
         through the repository, and returns the details of the created user.
 
         Args:
             request: A CreateUserRequest object containing the data for the new user.
 
         Raises:
-            ValueError: If a user with the same email address already exists.
+            UserAlreadyExistsError: If a user with the same email address
+                already exists.
 
         Returns:
             A CreateUserResponse object with the details of the newly created user.
         """
         if self.user_repository.find_by_email(request.email):
-            raise ValueError("An user with this email already exists")
+            raise UserAlreadyExistsError("An user with this email already exists")
         user = User(
             id=uuid4(),
             first_name=request.first_name,
             last_name=request.last_name,
             email=request.email,
-            hashed_password=hashlib.sha512(
-                request.password.encode("utf-8")
-            ).hexdigest(),
+            hashed_password=hash_password(request.password),
             shipping_address=request.shipping_address,
             cart_items=[],
         )
         saved_user = self.user_repository.save(user)
-        return CreateUserResponse(**saved_user.model_dump())
+        # The saved user is trusted data, so skip per-field validation.
+        return CreateUserResponse.construct(
+            id=saved_user.id,
+            first_name=saved_user.first_name,
+            last_name=saved_user.last_name,
+            email=saved_user.email,
+            shipping_address=saved_user.shipping_address,
+        )
 
 
 class AddItemToCartUseCase:
@@ -81,49 +126,57 @@ class AddItemToCartUseCase:
     ) -> AddToCartResponse:
         """Executes the process of adding an item to a user's cart.
 
+        The user is loaded in a worker thread while the item service is
+        awaited, so the two lookups run concurrently. The cart write runs in a
+        worker thread as well, so the event loop never blocks on the database.
+
         Validations performed:
         - Checks if the user exists.
-        - Checks if the item exists using the item_service.
-        - Checks if there is enough stock for the item using the item_service.
+        - Checks if the item exists and has enough stock with a single
+          item_service call.
         - Checks if the item is already present in the user's cart.
 
-        If all validations pass, the item is added to the user's cart,
-        the user entity is saved, and the updated cart contents are returned.
+        If all validations pass, the item is added to the user's cart through
+        the repository's `add_cart_item`, which writes just the new cart row,
+        and the updated cart contents are returned.
 
         Args:
             user_id: The ID of the user to whose cart the item will be added.
             request: An AddToCartRequest object containing the item ID and quantity.
 
         Raises:
-            ValueError: If the user does not exist, item does not exist, not enough stock,
-                        or item is already in the cart.
+            UserNotFoundError: If the user does not exist.
+            ItemNotFoundError: If the item does not exist.
+            InsufficientStockError: If there is not enough stock.
+            ItemAlreadyInCartError: If the item is already in the cart.
 
         Returns:
             An AddToCartResponse object representing the current state of the user's cart.
         """
-        user = self.user_repository.find_by_id(user_id)
+        # The user load is independent of the item lookup, so the two overlap.
+        user, (item, in_stock) = await asyncio.gather(
+            asyncio.to_thread(self.user_repository.find_by_id, user_id),
+            self.item_service.get_item_with_stock(
+                request.item_id, quantity=request.quantity
+            ),
+        )
         if not user:
-            raise ValueError("User does not exists")
-        item = await self.item_service.get_item(request.item_id)
+            raise UserNotFoundError("User does not exists")
         if not item:
-            raise ValueError("Item does not exists")
-        if not await self.item_service.check_stock(
-            request.item_id, quantity=request.quantity
-        ):
-            raise ValueError("Not enough items in stock")
-        if any(cart_item.item_id == request.item_id for cart_item in user.cart_items):
-            raise ValueError("Item already in cart")
+            raise ItemNotFoundError("Item does not exists")
+        if not in_stock:
+            raise InsufficientStockError("Not enough items in stock")
+        if user.has_cart_item(request.item_id):
+            raise ItemAlreadyInCartError("Item already in cart")
         cart_item = CartItem(
             user_id=user_id, item_id=request.item_id, quantity=request.quantity
         )
-        user.cart_items.append(cart_item)
-        self.user_repository.save(user)
-        return AddToCartResponse(
-            items=[
-                AddToCartRequest(item_id=cart_item.item_id, quantity=cart_item.quantity)
-                for cart_item in user.cart_items
-            ]
-        )
+        # Only the new row is written; a concurrent add of the same item loses.
+        # The write blocks on I/O, so it too runs in a worker thread.
+        if not await asyncio.to_thread(self.user_repository.add_cart_item, cart_item):
+            raise ItemAlreadyInCartError("Item already in cart")
+        user.add_cart_item(cart_item)
+        return _to_cart_response(user.cart_items)
 
 
 class ListItemsInCartUseCase:
@@ -147,9 +200,4 @@ class ListItemsInCartUseCase:
             cart.
         """
         cart_items = self.user_repository.find_cart_items(user_id)
-        return AddToCartResponse(
-            items=[
-                AddToCartRequest(item_id=cart_item.item_id, quantity=cart_item.quantity)
-                for cart_item in cart_items
-            ]
-        )
+        return _to_cart_response(cart_items)
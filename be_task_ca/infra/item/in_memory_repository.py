@@ -4,6 +4,7 @@ It's primarily used for testing or development environments where a persistent
 database is not required. Item data is stored in a Python dictionary in memory.
 """
 
+import threading
 from uuid import UUID
 
 from be_task_ca.domain.item.entities import Item
@@ -16,33 +17,44 @@ class InMemoryItemRepository(ItemRepository):
     This class implements the ItemRepository interface, storing item data
     in a dictionary in memory. It's suitable for testing or scenarios
     where data persistence across sessions is not needed.
+
+    A single instance may be shared across requests served from FastAPI's
+    threadpool, so writes and full scans are guarded by a lock.
     """
 
     def __init__(self) -> None:
-        self._items: dict[UUID, Item] = {}
+        # Keyed by `UUID.int`, whose hashing and comparison run in C, unlike
+        # the Python-level `UUID.__hash__`/`__eq__`.
+        self._items: dict[int, Item] = {}
+        self._by_name: dict[str, int] = {}
+        self._lock = threading.Lock()
 
     def save(self, item: Item) -> Item:
         """Saves an item to the in-memory store.
 
-        A copy of the item is created to ensure that modifications
-        to the input object outside this repository do not affect the stored version.
+        Items are immutable, so the given instance is stored as is; no copy is
+        needed to keep later changes by the caller out of the store.
 
         Args:
             item: The Item entity to save.
 
+        Raises:
+            ValueError: If another item with the same name already exists.
+
         Returns:
-            The saved Item entity (a copy of the input).
+            The saved Item entity.
         """
-        # Create a copy to avoid modifying the input
-        saved_item = Item(
-            id=item.id,
-            name=item.name,
-            description=item.description,
-            price=item.price,
-            quantity=item.quantity,
-        )
-        self._items[item.id] = saved_item
-        return saved_item
+        with self._lock:
+            key = item.id.int
+            owner_key = self._by_name.get(item.name)
+            if owner_key is not None and owner_key != key:
+                raise ValueError("An item with this name already exists")
+            previous = self._items.get(key)
+            if previous is not None and previous.name != item.name:
+                del self._by_name[previous.name]
+            self._items[key] = item
+            self._by_name[item.name] = key
+        return item
 
     def find_by_id(self, item_id: UUID) -> Item | None:
         """Finds an item by its unique ID in the in-memory store.
@@ -53,21 +65,7 @@ class InMemoryItemRepository(ItemRepository):
         Returns:
             The Item entity if found, otherwise None.
         """
-        return self._items.get(item_id)
-
-    def find_by_name(self, name: str) -> Item | None:
-        """Finds an item by its name in the in-memory store.
-
-        Args:
-            name: The name of the item to find.
-
-        Returns:
-            The Item entity if found, otherwise None.
-        """
-        for item in self._items.values():
-            if item.name == name:
-                return item
-        return None
+        return self._items.get(item_id.int)
 
     def get_all(self) -> list[Item]:
         """Retrieves all items from the in-memory store.
@@ -75,4 +73,5 @@ class InMemoryItemRepository(ItemRepository):
         Returns:
             A list of all Item entities currently stored.
         """
-        return list(self._items.values())
+        with self._lock:
+            return list(self._items.values())
@@ -5,9 +5,9 @@ This model represents the structure of the 'items' table in the database.
 """
 
 from dataclasses import dataclass
-from decimal import Decimal
 from uuid import UUID, uuid4
 
+from sqlalchemy import BigInteger
 from sqlalchemy.orm import Mapped, mapped_column
 
 from be_task_ca.infra.database import Base
@@ -19,8 +19,8 @@ class ItemModel(Base):
 
     __tablename__ = "items"
 
-    id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4, index=True)
+    id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
     name: Mapped[str] = mapped_column(unique=True, index=True)
     description: Mapped[str | None] = mapped_column(default=None)
-    price: Mapped[Decimal] = mapped_column(default=0)
+    price_cents: Mapped[int] = mapped_column(BigInteger, default=0)
     quantity: Mapped[int] = mapped_column(default=0)
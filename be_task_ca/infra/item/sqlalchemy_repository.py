@@ -4,23 +4,46 @@ It handles the persistence and retrieval of Item entities using SQLAlchemy
 to interact with a relational database.
 """
 
+from collections.abc import Iterator
 from uuid import UUID
 
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, scoped_session
 
 from be_task_ca.domain.item.entities import Item
 from be_task_ca.infra.item.models import ItemModel
 from be_task_ca.interfaces.item import ItemRepository
 
+# Rows fetched per round-trip when streaming the whole items table.
+GET_ALL_BATCH_SIZE = 500
+
+# PostgreSQL SQLSTATE for unique_violation.
+UNIQUE_VIOLATION = "23505"
+
+# SQLite extended result code name for a UNIQUE constraint failure.
+SQLITE_UNIQUE_VIOLATION = "SQLITE_CONSTRAINT_UNIQUE"
+
+
+def _is_unique_violation(error: IntegrityError) -> bool:
+    """Tells whether an IntegrityError was raised by a UNIQUE constraint."""
+    return (
+        getattr(error.orig, "pgcode", None) == UNIQUE_VIOLATION
+        or getattr(error.orig, "sqlite_errorname", None) == SQLITE_UNIQUE_VIOLATION
+    )
+
 
 class SQLAlchemyItemRepository(ItemRepository):
     """A repository class for Item entities that uses SQLAlchemy for database operations.
 
     This class implements the ItemRepository interface, providing concrete methods
     to save, find, and retrieve items from a database via SQLAlchemy.
+
+    `db` may be a plain Session or a `scoped_session`, in which case every
+    call runs on the session of the current scope.
     """
 
-    def __init__(self, db: Session) -> None:
+    def __init__(self, db: Session | scoped_session[Session]) -> None:
         self.db = db
 
     def save(self, item: Item) -> Item:
@@ -29,85 +52,93 @@ class SQLAlchemyItemRepository(ItemRepository):
         If the item already exists (e.g., based on its ID), it is updated.
         If it's a new item, it is created.
 
+        Duplicate names are detected by the unique index on `items.name` when
+        the transaction is committed, so no separate lookup is needed.
+
         Args:
             item: The Item entity to save.
 
+        Raises:
+            ValueError: If another item with the same name already exists.
+
         Returns:
             The saved Item entity, potentially with updated fields (e.g., generated
             ID or timestamps).
         """
-        db_item = self.db.query(ItemModel).filter(ItemModel.id == item.id).first()
+        db_item = self.db.get(ItemModel, item.id)
         if not db_item:
             db_item = ItemModel(
                 id=item.id,
                 name=item.name,
                 description=item.description,
-                price=item.price,
+                price_cents=item.price_cents,
                 quantity=item.quantity,
             )
             self.db.add(db_item)
         else:
             db_item.name = item.name
             db_item.description = item.description
-            db_item.price = item.price
+            db_item.price_cents = item.price_cents
             db_item.quantity = item.quantity
-        self.db.commit()
+        try:
+            self.db.commit()
+        except IntegrityError as e:
+            self.db.rollback()
+            if _is_unique_violation(e):
+                raise ValueError("An item with this name already exists") from e
+            raise
         return item
 
-    def find_by_name(self, name: str) -> Item | None:
-        """Finds an item by its name.
-
-        Args:
-            name: The name of the item to find.
-
-        Returns:
-            The Item entity if found, otherwise None.
-        """
-        db_item = self.db.query(ItemModel).filter(ItemModel.name == name).first()
-        if db_item:
-            return Item(
-                id=db_item.id,
-                name=db_item.name,
-                description=db_item.description,
-                price=db_item.price,
-                quantity=db_item.quantity,
-            )
-        return None
-
     def find_by_id(self, id: UUID) -> Item | None:
         """Finds an item by its unique identifier.
 
+        The session's identity map is consulted first, so an item already loaded
+        in this session is returned without a round-trip.
+
         Args:
             id: The UUID of the item to find.
 
         Returns:
             The Item entity if found, otherwise None.
         """
-        db_item = self.db.query(ItemModel).filter(ItemModel.id == id).first()
+        db_item = self.db.get(ItemModel, id)
         if db_item:
             return Item(
                 id=db_item.id,
                 name=db_item.name,
                 description=db_item.description,
-                price=db_item.price,
+                price_cents=db_item.price_cents,
                 quantity=db_item.quantity,
             )
         return None
 
-    def get_all(self) -> list[Item]:
+    def get_all(self) -> Iterator[Item]:
         """Retrieves all items from the repository.
 
+        Only the item columns are selected, so rows come back as plain tuples
+        and skip ORM instance hydration and identity-map bookkeeping. They are
+        streamed from the database in batches of `GET_ALL_BATCH_SIZE` instead
+        of being loaded all at once.
+
         Returns:
-            A list of all Item entities.
+            An iterator over all Item entities.
         """
-        db_items = self.db.query(ItemModel).all()
-        return [
+        rows = self.db.execute(
+            select(
+                ItemModel.id,
+                ItemModel.name,
+                ItemModel.description,
+                ItemModel.price_cents,
+                ItemModel.quantity,
+            ).execution_options(yield_per=GET_ALL_BATCH_SIZE)
+        )
+        return (
             Item(
-                id=item.id,
-                name=item.name,
-                description=item.description,
-                price=item.price,
-                quantity=item.quantity,
+                id=id,
+                name=name,
+                description=description,
+                price_cents=price_cents,
+                quantity=quantity,
             )
-            for item in db_items
-        ]
+            for id, name, description, price_cents, quantity in rows
+        )
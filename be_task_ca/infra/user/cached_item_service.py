@@ -0,0 +1,89 @@
+"""This module provides a caching decorator for ItemService implementations.
+
+Catalog items change far less often than carts, so item lookups made while
+adding to a cart can be answered from a short-lived in-process cache instead
+of reaching the underlying service on every request.
+"""
+
+import time
+from collections import OrderedDict
+from uuid import UUID
+
+from be_task_ca.interfaces.user import ItemService
+
+# Cached `get_item_with_stock` results kept before the oldest is evicted.
+DEFAULT_MAXSIZE = 10_000
+
+
+class CachedItemService(ItemService):
+    """An ItemService that caches `get_item_with_stock` results for a short TTL.
+
+    Results are keyed by `(item_id, quantity)` and only cached when the item
+    exists, so newly created items become visible immediately. `get_item` and
+    `check_stock` are passed straight through to the wrapped service.
+
+    The cache is not locked: it is only used from async request handlers
+    running on the event loop.
+    """
+
+    def __init__(
+        self, item_service: ItemService, ttl: float, maxsize: int = DEFAULT_MAXSIZE
+    ) -> None:
+        self._item_service = item_service
+        self._ttl = ttl
+        self._maxsize = maxsize
+        self._entries: OrderedDict[
+            tuple[UUID, int], tuple[float, tuple[dict | None, bool]]
+        ] = OrderedDict()
+
+    async def get_item(self, item_id: UUID) -> dict | None:
+        """Retrieves an item from the wrapped service.
+
+        Args:
+            item_id: The unique identifier of the item to retrieve.
+
+        Returns:
+            A dictionary containing item details if found, otherwise None.
+        """
+        return await self._item_service.get_item(item_id)
+
+    async def check_stock(self, item_id: UUID, quantity: int) -> bool:
+        """Checks stock through the wrapped service.
+
+        Args:
+            item_id: The unique identifier of the item to check.
+            quantity: The desired quantity to check against the stock.
+
+        Returns:
+            True if the requested quantity is available, False otherwise.
+        """
+        return await self._item_service.check_stock(item_id, quantity)
+
+    async def get_item_with_stock(
+        self, item_id: UUID, quantity: int
+    ) -> tuple[dict | None, bool]:
+        """Retrieves an item and its stock status, serving repeats from the cache.
+
+        On a miss or an expired entry the wrapped service is called and, if the
+        item exists, the result is cached for `ttl` seconds. The least recently
+        stored entry is evicted once `maxsize` is exceeded.
+
+        Args:
+            item_id: The unique identifier of the item to retrieve.
+            quantity: The desired quantity to check against the stock.
+
+        Returns:
+            An `(item, in_stock)` tuple as returned by the wrapped service.
+        """
+        key = (item_id, quantity)
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+        result = await self._item_service.get_item_with_stock(item_id, quantity)
+        if result[0] is not None:
+            self._entries[key] = (now + self._ttl, result)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+        return result
@@ -5,77 +5,117 @@ database is not required. User and cart item data is stored in Python dictionari
 and lists in memory.
 """
 
+import dataclasses
+import threading
 from uuid import UUID
 
 from be_task_ca.domain.user.entities import CartItem, User
 from be_task_ca.interfaces.user import UserRepository
 
 
+def _copy(user: User) -> User:
+    """Copies a user together with its cart, rebuilding the cart item index."""
+    return dataclasses.replace(user, cart_items=list(user.cart_items))
+
+
 class InMemoryUserRepository(UserRepository):
     """An in-memory repository for User entities.
 
     This class implements the UserRepository interface, storing user data
     in a dictionary in memory. It's suitable for testing or scenarios
     where data persistence across sessions is not needed.
+
+    A single instance may be shared across requests served from FastAPI's
+    threadpool, so writes and full scans are guarded by a lock.
     """
 
     def __init__(self) -> None:
-        self._users: dict[UUID, User] = {}
+        # Keyed by `UUID.int`, whose hashing and comparison run in C, unlike
+        # the Python-level `UUID.__hash__`/`__eq__`.
+        self._users: dict[int, User] = {}
+        self._by_email: dict[str, int] = {}
+        self._lock = threading.Lock()
 
     def save(self, user: User) -> User:
         """Saves a user to the in-memory store.
 
-        A deep copy of the user and its cart items is created to ensure
-        that modifications to the input object outside this repository
-        do not affect the stored version.
+        The user and its cart list are copied, so changes made to `user`
+        after saving, such as `add_cart_item`, are not seen by the repository
+        until it is saved again. Cart items are immutable and are shared.
 
         Args:
             user: The User entity to save.
 
         Returns:
-            The saved User entity (a deep copy of the input).
+            The saved User entity.
+        """
+        saved_user = _copy(user)
+        with self._lock:
+            key = user.id.int
+            previous = self._users.get(key)
+            if (
+                previous is not None
+                and previous.email != user.email
+                and self._by_email.get(previous.email) == key
+            ):
+                del self._by_email[previous.email]
+            self._users[key] = saved_user
+            self._by_email[user.email] = key
+        return user
+
+    def add_cart_item(self, cart_item: CartItem) -> bool:
+        """Adds a single item to a user's cart unless it is already there.
+
+        The stored user is replaced by a copy with the extended cart, so User
+        instances previously returned by this repository are not modified.
+
+        Args:
+            cart_item: The CartItem to add.
+
+        Returns:
+            True if the item was added, False if the cart already contained it
+            or the user does not exist.
         """
-        # Create a deep copy to avoid modifying the input
-        cart_items = [
-            CartItem(user_id=item.user_id, item_id=item.item_id, quantity=item.quantity)
-            for item in user.cart_items
-        ]
-        saved_user = User(
-            id=user.id,
-            email=user.email,
-            first_name=user.first_name,
-            last_name=user.last_name,
-            hashed_password=user.hashed_password,
-            shipping_address=user.shipping_address,
-            cart_items=cart_items,
-        )
-        self._users[user.id] = saved_user
-        return saved_user
+        with self._lock:
+            key = cart_item.user_id.int
+            user = self._users.get(key)
+            if user is None or user.has_cart_item(cart_item.item_id):
+                return False
+            self._users[key] = dataclasses.replace(
+                user, cart_items=[*user.cart_items, cart_item]
+            )
+        return True
 
     def find_by_email(self, email: str) -> User | None:
         """Finds a user by their email address in the in-memory store.
 
+        Like `find_by_id`, this returns a copy of the stored user.
+
         Args:
             email: The email address to search for.
 
         Returns:
             The User entity if found, otherwise None.
         """
-        for user in self._users.values():
-            if user.email == email:
-                return user
-        return None
+        with self._lock:
+            key = self._by_email.get(email)
+            user = self._users.get(key) if key is not None else None
+        return _copy(user) if user is not None else None
 
     def find_by_id(self, user_id: UUID) -> User | None:
         """Finds a user by their unique ID in the in-memory store.
 
+        A copy of the stored user is returned, so changing it does not affect
+        the store until it is saved.
+
         Args:
             user_id: The UUID of the user to search for.
 
         Returns:
             The User entity if found, otherwise None.
         """
-        return self._users.get(user_id)
+        user = self._users.get(user_id.int)
+        return _copy(user) if user is not None else None
 
     def find_cart_items(self, user_id: UUID) -> list[CartItem]:
         """Finds all cart items for a given user ID in the in-memory store.
@@ -87,5 +127,5 @@ class InMemoryUserRepository(UserRepository):
             A list of CartItem entities associated with the user.
             Returns an empty list if the user is not found or has no cart items.
         """
-        user = self._users.get(user_id)
-        return user.cart_items if user else []
+        user = self._users.get(user_id.int)
+        return list(user.cart_items) if user else []
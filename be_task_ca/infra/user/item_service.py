@@ -9,6 +9,9 @@ from uuid import UUID
 
 from be_task_ca.interfaces.user import ItemService
 
+# Every item the mock knows about looks like this, with its own id filled in.
+_MOCK_ITEM = {"id": None, "name": "Mock Item", "quantity": 12}
+
 
 class MockItemService(ItemService):
     """A mock implementation of the ItemService interface.
@@ -35,11 +38,7 @@ class MockItemService(ItemService):
             A dictionary containing mock item details.
         """
         # Mock implementation; replace with actual API call in production
-        return {
-            "id": item_id,
-            "name": "Mock Item",
-            "quantity": 12,
-        }
+        return {**_MOCK_ITEM, "id": item_id}
 
     async def check_stock(self, item_id: UUID, quantity: int) -> bool:
         """Checks if a mock item has sufficient stock based on its mock quantity.
@@ -53,5 +52,19 @@ class MockItemService(ItemService):
             requested quantity, False otherwise.
         """
         # Mock implementation; replace with actual API call in production
-        item = await self.get_item(item_id)
-        return item is not None and item["quantity"] >= quantity
+        return quantity <= _MOCK_ITEM["quantity"]
+
+    async def get_item_with_stock(
+        self, item_id: UUID, quantity: int
+    ) -> tuple[dict | None, bool]:
+        """Retrieves a mock item and checks its stock with a single lookup.
+
+        Args:
+            item_id: The UUID of the item to retrieve.
+            quantity: The desired quantity to check.
+
+        Returns:
+            A tuple of the mock item details and whether its quantity covers
+            the requested one.
+        """
+        return {**_MOCK_ITEM, "id": item_id}, quantity <= _MOCK_ITEM["quantity"]
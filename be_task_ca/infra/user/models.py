@@ -7,7 +7,7 @@ These models represent the structure of the 'users' and 'cart_items' tables.
 from dataclasses import dataclass
 from uuid import UUID, uuid4
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from be_task_ca.infra.database import Base
@@ -30,7 +30,7 @@ class UserModel(Base):
 
     __tablename__ = "users"
 
-    id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4, index=True)
+    id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
     email: Mapped[str] = mapped_column(unique=True, index=True)
     first_name: Mapped[str] = mapped_column(nullable=False)
     last_name: Mapped[str] = mapped_column(nullable=False)
@@ -44,10 +44,14 @@ class CartItemModel(Base):
     """SQLAlchemy model representing an item in a user's shopping cart.
 
     This table acts as a join table between users and items, also storing
-    the quantity of each item in a specific user's cart.
+    the quantity of each item in a specific user's cart. The covering index
+    lets cart listings by user be answered from the index alone.
     """
 
     __tablename__ = "cart_items"
+    __table_args__ = (
+        Index("ix_cart_items_user_covering", "user_id", "item_id", "quantity"),
+    )
 
     user_id: Mapped[UUID] = mapped_column(ForeignKey("users.id"), primary_key=True)
     item_id: Mapped[UUID] = mapped_column(ForeignKey("items.id"), primary_key=True)
@@ -4,14 +4,27 @@ It handles the persistence and retrieval of User and CartItem entities using
 SQLAlchemy to interact with a relational database.
 """
 
+from collections.abc import Callable, Iterator
 from uuid import UUID
 
-from sqlalchemy.orm import Session
+from sqlalchemy import Insert, delete, insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session, joinedload, scoped_session
 
 from be_task_ca.domain.user.entities import CartItem, User
 from be_task_ca.infra.user.models import CartItemModel, UserModel
 from be_task_ca.interfaces.user import UserRepository
 
+# Rows fetched per round-trip when streaming a user's cart.
+CART_ITEMS_BATCH_SIZE = 256
+
+# Dialect-specific INSERT constructs that support ON CONFLICT clauses. Other
+# dialects fall back to ORM reads and writes.
+UPSERT_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
 
 class SQLAlchemyUserRepository(UserRepository):
     """A repository class for User entities that uses SQLAlchemy for database operations.
@@ -19,16 +32,33 @@ class SQLAlchemyUserRepository(UserRepository):
     This class implements the UserRepository interface, providing concrete methods
     to save, find, and manage users and their shopping carts in a database
     via SQLAlchemy. It interacts with UserModel and CartItemModel SQLAlchemy models.
+
+    `db` may be a plain Session or a `scoped_session`, in which case every
+    call runs on the session of the current scope.
     """
 
-    def __init__(self, db: Session) -> None:
+    def __init__(self, db: Session | scoped_session[Session]) -> None:
         self.db = db
 
+    def _upsert_insert(self) -> Callable[..., Insert] | None:
+        """Returns the ON CONFLICT capable INSERT for the session's dialect.
+
+        The dialect is looked up per call because a `scoped_session` only has
+        a bind inside a request scope.
+
+        Returns:
+            The dialect's `insert` function, or None if it has no ON CONFLICT
+            support.
+        """
+        return UPSERT_INSERTS.get(self.db.get_bind().dialect.name)
+
     def save(self, user: User) -> User:
         """Saves a user to the repository.
 
-        If the user already exists (e.g., based on their ID), they should be updated.
-        If it's a new user, they should be created.
+        The user row is written with a single `INSERT ... ON CONFLICT (id) DO
+        UPDATE`, or with `Session.merge` on dialects without ON CONFLICT. The
+        cart is replaced with one DELETE plus one bulk INSERT, all committed
+        in one transaction.
 
         Args:
             user: The User entity to save.
@@ -37,102 +67,175 @@ class SQLAlchemyUserRepository(UserRepository):
             The saved User entity, potentially with updated fields (e.g., generated ID
             or timestamps).
         """
-        db_user = self.db.query(UserModel).filter(UserModel.id == user.id).first()
-        if not db_user:
-            db_user = UserModel(
-                id=user.id,
-                email=user.email,
-                first_name=user.first_name,
-                last_name=user.last_name,
-                hashed_password=user.hashed_password,
-                shipping_address=user.shipping_address,
-            )
-            self.db.add(db_user)
+        values = {
+            "id": user.id,
+            "email": user.email,
+            "first_name": user.first_name,
+            "last_name": user.last_name,
+            "hashed_password": user.hashed_password,
+            "shipping_address": user.shipping_address,
+        }
+        dialect_insert = self._upsert_insert()
+        if dialect_insert is None:
+            self.db.merge(UserModel(**values))
         else:
-            db_user.email = user.email
-            db_user.first_name = user.first_name
-            db_user.last_name = user.last_name
-            db_user.hashed_password = user.hashed_password
-            db_user.shipping_address = user.shipping_address
-
-        # Clear existing cart items and add new ones
-        self.db.query(CartItemModel).filter(CartItemModel.user_id == user.id).delete()
-        for cart_item in user.cart_items:
-            db_cart_item = CartItemModel(
+            upsert = dialect_insert(UserModel).values(values)
+            self.db.execute(
+                upsert.on_conflict_do_update(
+                    index_elements=[UserModel.id],
+                    set_={
+                        "email": upsert.excluded.email,
+                        "first_name": upsert.excluded.first_name,
+                        "last_name": upsert.excluded.last_name,
+                        "hashed_password": upsert.excluded.hashed_password,
+                        "shipping_address": upsert.excluded.shipping_address,
+                    },
+                )
+            )
+
+        # Replace the cart: one DELETE, then one executemany INSERT
+        self.db.execute(delete(CartItemModel).where(CartItemModel.user_id == user.id))
+        if user.cart_items:
+            self.db.execute(
+                insert(CartItemModel),
+                [
+                    {
+                        "user_id": cart_item.user_id,
+                        "item_id": cart_item.item_id,
+                        "quantity": cart_item.quantity,
+                    }
+                    for cart_item in user.cart_items
+                ],
+            )
+
+        self.db.commit()
+        return user
+
+    def add_cart_item(self, cart_item: CartItem) -> bool:
+        """Adds a single item to a user's cart unless it is already there.
+
+        Runs one `INSERT ... ON CONFLICT (user_id, item_id) DO NOTHING`, so
+        duplicate detection happens in the database on the cart's primary key
+        instead of by loading and rewriting the whole cart. Dialects without
+        ON CONFLICT look the cart item up by primary key before adding it.
+
+        Args:
+            cart_item: The CartItem to add.
+
+        Returns:
+            True if the item was added, False if the cart already contained it.
+        """
+        dialect_insert = self._upsert_insert()
+        if dialect_insert is None:
+            key = (cart_item.user_id, cart_item.item_id)
+            if self.db.get(CartItemModel, key) is not None:
+                return False
+            self.db.add(
+                CartItemModel(
+                    user_id=cart_item.user_id,
+                    item_id=cart_item.item_id,
+                    quantity=cart_item.quantity,
+                )
+            )
+            self.db.commit()
+            return True
+        result = self.db.execute(
+            dialect_insert(CartItemModel)
+            .values(
                 user_id=cart_item.user_id,
                 item_id=cart_item.item_id,
                 quantity=cart_item.quantity,
             )
-            self.db.add(db_cart_item)
-
+            .on_conflict_do_nothing(
+                index_elements=[CartItemModel.user_id, CartItemModel.item_id]
+            )
+        )
         self.db.commit()
-        return user
+        return result.rowcount == 1
 
     def find_by_email(self, email: str) -> User | None:
         """Finds a user by their email address.
 
+        The user's cart items are joined-eager-loaded, so the user and the
+        cart arrive in a single SQL round-trip.
+
         Args:
             email: The email address of the user to find.
 
         Returns:
             The User entity if found, otherwise None.
         """
-        db_user = self.db.query(UserModel).filter(UserModel.email == email).first()
-        if db_user:
-            cart_items = self.find_cart_items(db_user.id)
-            return User(
-                id=db_user.id,
-                email=db_user.email,
-                first_name=db_user.first_name,
-                last_name=db_user.last_name,
-                hashed_password=db_user.hashed_password,
-                shipping_address=db_user.shipping_address,
-                cart_items=cart_items,
+        db_user = (
+            self.db.execute(
+                select(UserModel)
+                .options(joinedload(UserModel.cart_items))
+                .where(UserModel.email == email)
             )
-        return None
+            .unique()
+            .scalar_one_or_none()
+        )
+        return self._to_entity(db_user) if db_user is not None else None
 
     def find_by_id(self, user_id: UUID) -> User | None:
         """Finds a user by their unique identifier.
 
+        The session's identity map is consulted first, so a user already loaded
+        in this session is returned without a round-trip. Otherwise the user's
+        cart items are joined-eager-loaded, so the user and the cart arrive in
+        a single SQL round-trip.
+
         Args:
             user_id: The UUID of the user to find.
 
         Returns:
             The User entity if found, otherwise None.
         """
-        db_user = self.db.query(UserModel).filter(UserModel.id == user_id).first()
-        if db_user:
-            cart_items = self.find_cart_items(db_user.id)
-            return User(
-                id=db_user.id,
-                email=db_user.email,
-                first_name=db_user.first_name,
-                last_name=db_user.last_name,
-                hashed_password=db_user.hashed_password,
-                shipping_address=db_user.shipping_address,
-                cart_items=cart_items,
-            )
-        return None
+        db_user = self.db.get(
+            UserModel, user_id, options=[joinedload(UserModel.cart_items)]
+        )
+        return self._to_entity(db_user) if db_user is not None else None
+
+    @staticmethod
+    def _to_entity(db_user: UserModel) -> User:
+        """Maps a loaded UserModel and its cart items to a User entity."""
+        return User(
+            id=db_user.id,
+            email=db_user.email,
+            first_name=db_user.first_name,
+            last_name=db_user.last_name,
+            hashed_password=db_user.hashed_password,
+            shipping_address=db_user.shipping_address,
+            cart_items=[
+                CartItem(
+                    user_id=db_cart_item.user_id,
+                    item_id=db_cart_item.item_id,
+                    quantity=db_cart_item.quantity,
+                )
+                for db_cart_item in db_user.cart_items
+            ],
+        )
 
-    def find_cart_items(self, user_id: UUID) -> list[CartItem]:
+    def find_cart_items(self, user_id: UUID) -> Iterator[CartItem]:
         """Retrieves all cart items associated with a specific user.
 
+        Only the needed columns are selected, so rows are plain tuples rather
+        than hydrated ORM instances. They are streamed in batches of
+        `CART_ITEMS_BATCH_SIZE`, so the whole cart is never buffered at once.
+
         Args:
             user_id: The unique identifier of the user whose cart items are to
                 be retrieved.
 
         Returns:
-            A list of CartItem entities. Returns an empty list if the user has
-            no cart items or does not exist.
+            An iterator over the user's CartItem entities. It is empty if the
+            user has no cart items or does not exist.
         """
-        db_cart_items = (
-            self.db.query(CartItemModel).filter(CartItemModel.user_id == user_id).all()
+        rows = self.db.execute(
+            select(CartItemModel.item_id, CartItemModel.quantity)
+            .where(CartItemModel.user_id == user_id)
+            .execution_options(yield_per=CART_ITEMS_BATCH_SIZE)
+        )
+        return (
+            CartItem(user_id=user_id, item_id=item_id, quantity=quantity)
+            for item_id, quantity in rows
         )
-        return [
-            CartItem(
-                user_id=db_cart_item.user_id,
-                item_id=db_cart_item.item_id,
-                quantity=db_cart_item.quantity,
-            )
-            for db_cart_item in db_cart_items
-        ]
@@ -6,6 +6,7 @@ loose coupling and testability.
 """
 
 import abc
+from collections.abc import Iterable
 from uuid import UUID
 
 from be_task_ca.domain.item.entities import Item
@@ -23,29 +24,21 @@ class ItemRepository(abc.ABC):
         """Saves an item to the repository.
 
         If the item already exists (e.g., based on its ID), it should be updated.
-        If it's a new item, it should be created.
+        If it's a new item, it should be created. Item names are unique; the
+        check must be done atomically with the write.
 
         Args:
             item: The Item entity to save.
 
+        Raises:
+            ValueError: If another item with the same name already exists.
+
         Returns:
             The saved Item entity, potentially with updated fields (e.g., generated
             ID or timestamps).
         """
         raise NotImplementedError
 
-    @abc.abstractmethod
-    def find_by_name(self, name: str) -> Item | None:
-        """Finds an item by its name.
-
-        Args:
-            name: The name of the item to find.
-
-        Returns:
-            The Item entity if found, otherwise None.
-        """
-        raise NotImplementedError
-
     @abc.abstractmethod
     def find_by_id(self, id: UUID) -> Item | None:
         """Finds an item by its unique identifier.
@@ -59,10 +52,13 @@ class ItemRepository(abc.ABC):
         raise NotImplementedError
 
     @abc.abstractmethod
-    def get_all(self) -> list[Item]:
+    def get_all(self) -> Iterable[Item]:
         """Retrieves all items from the repository.
 
+        Implementations backed by a database may return a lazy iterator that
+        fetches rows in batches, so callers should iterate the result only once.
+
         Returns:
-            A list of all Item entities.
+            An iterable of all Item entities.
         """
         raise NotImplementedError
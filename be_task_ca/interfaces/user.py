@@ -6,6 +6,7 @@ loose coupling and testability within the user domain.
 """
 
 import abc
+from collections.abc import Iterable
 from uuid import UUID
 
 from be_task_ca.domain.user.entities import CartItem, User
@@ -34,6 +35,21 @@ class UserRepository(abc.ABC):
         """
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def add_cart_item(self, cart_item: CartItem) -> bool:
+        """Adds a single item to a user's cart unless it is already there.
+
+        Unlike `save`, only the new cart row is written; the user and the rest
+        of the cart are left untouched.
+
+        Args:
+            cart_item: The CartItem to add.
+
+        Returns:
+            True if the item was added, False if the cart already contained it.
+        """
+        raise NotImplementedError
+
     @abc.abstractmethod
     def find_by_email(self, email: str) -> User | None:
         """Finds a user by their email address.
@@ -59,16 +75,19 @@ class UserRepository(abc.ABC):
         raise NotImplementedError
 
     @abc.abstractmethod
-    def find_cart_items(self, user_id: UUID) -> list[CartItem]:
+    def find_cart_items(self, user_id: UUID) -> Iterable[CartItem]:
         """Retrieves all cart items associated with a specific user.
 
+        Implementations backed by a database may return a lazy iterator that
+        fetches rows in batches, so callers should iterate the result only once.
+
         Args:
             user_id: The unique identifier of the user whose cart items are to
                 be retrieved.
 
         Returns:
-            A list of CartItem entities. Returns an empty list if the user has
-            no cart items or does not exist.
+            An iterable of CartItem entities. It is empty if the user has no
+            cart items or does not exist.
         """
         raise NotImplementedError
 
@@ -108,3 +127,25 @@ class ItemService(abc.ABC):
             False otherwise.
         """
         raise NotImplementedError
+
+    async def get_item_with_stock(
+        self, item_id: UUID, quantity: int
+    ) -> tuple[dict | None, bool]:
+        """Retrieves an item together with whether enough of it is in stock.
+
+        The default implementation awaits `get_item` and then `check_stock`.
+        Implementations that can answer both from a single lookup should
+        override it.
+
+        Args:
+            item_id: The unique identifier of the item to retrieve.
+            quantity: The desired quantity to check against the stock.
+
+        Returns:
+            An `(item, in_stock)` tuple. If the item does not exist, `item` is
+            None and `in_stock` is False.
+        """
+        item = await self.get_item(item_id)
+        if item is None:
+            return None, False
+        return item, await self.check_stock(item_id, quantity)
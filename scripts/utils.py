@@ -1,7 +1,17 @@
 import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
 
 import uvicorn
 
+# Read-only checks run together by `check_all`.
+CHECK_COMMANDS = [
+    ["black", "--check", "be_task_ca"],
+    ["flake8", "be_task_ca"],
+    ["mypy", "be_task_ca"],
+    ["pytest", "-q"],
+]
+
 
 def start() -> None:
     """Starts the Uvicorn server for the FastAPI application."""
@@ -10,17 +20,17 @@ def start() -> None:
 
 def auto_format() -> None:
     """Formats the code in the 'be_task_ca' directory using Black."""
-    subprocess.call(["black", "be_task_ca"])
+    subprocess.run(["black", "be_task_ca"], check=False)
 
 
 def run_linter() -> None:
     """Runs the Flake8 linter on the 'be_task_ca' directory."""
-    subprocess.call(["flake8", "be_task_ca"])
+    subprocess.run(["flake8", "be_task_ca"], check=False)
 
 
 def run_tests() -> None:
     """Runs Pytest to execute automated tests."""
-    subprocess.call(["pytest"])
+    subprocess.run(["pytest"], check=False)
 
 
 def create_dependency_graph() -> None:
@@ -28,9 +38,29 @@ def create_dependency_graph() -> None:
 
     The '--cluster' option groups related modules together in the graph.
     """
-    subprocess.call(["pydeps", "be_task_ca", "--cluster"])
+    subprocess.run(["pydeps", "be_task_ca", "--cluster"], check=False)
 
 
 def check_types() -> None:
     """Runs MyPy to perform static type checking on the 'be_task_ca' directory."""
-    subprocess.call(["mypy", "be_task_ca"])
+    subprocess.run(["mypy", "be_task_ca"], check=False)
+
+
+def _run_captured(command: list[str]) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(command, capture_output=True, text=True, check=False)
+
+
+def check_all() -> None:
+    """Runs the formatter check, linter, type checker and tests concurrently.
+
+    Each tool runs in its own subprocess, so the wall time is that of the
+    slowest one. Outputs are printed in a fixed order once all have finished,
+    and the process exits with the highest return code.
+    """
+    with ThreadPoolExecutor(max_workers=len(CHECK_COMMANDS)) as executor:
+        results = list(executor.map(_run_captured, CHECK_COMMANDS))
+    for command, result in zip(CHECK_COMMANDS, results, strict=True):
+        print(f"$ {' '.join(command)}")
+        sys.stdout.write(result.stdout)
+        sys.stderr.write(result.stderr)
+    sys.exit(max(result.returncode for result in results))
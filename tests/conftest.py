@@ -3,51 +3,232 @@
 Fixtures defined here are automatically available to all tests in the
 `tests` directory and its subdirectories. These fixtures primarily provide
 mocked versions of repository and service interfaces for dependency injection
-during testing.
+during testing, plus an in-memory SQLite database for the SQLAlchemy
+repositories.
 """
 
+import asyncio
+from collections.abc import Callable, Iterator
+from uuid import uuid4
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, Mock
+from sqlalchemy import Engine, create_engine, event
 from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+from be_task_ca.domain.item.entities import Item
+from be_task_ca.domain.user.entities import CartItem, User
+from be_task_ca.infra.database import Base
+from be_task_ca.infra.item.models import ItemModel  # noqa: F401
+from be_task_ca.infra.user.models import UserModel  # noqa: F401
 from be_task_ca.interfaces.item import ItemRepository
 from be_task_ca.interfaces.user import UserRepository, ItemService
 
+# Transaction-control statements, left out of `sql_statements`.
+TRANSACTION_CONTROL = ("BEGIN", "SAVEPOINT", "RELEASE", "ROLLBACK", "COMMIT")
+
+
+def _reset(mock: Mock) -> Mock:
+    """Clears the calls and configuration a previous test left on `mock`."""
+    mock.reset_mock(return_value=True, side_effect=True)
+    return mock
+
+
+# Mock construction is slow compared with resetting, so each mock is built once
+# per session and reset before every test. A shallow copy would share the child
+# mocks (and so their calls) between tests. Plain Mock is used because no test
+# needs the magic-method protocol MagicMock sets up.
+@pytest.fixture(scope="session")
+def _item_repository_template() -> Mock:
+    return Mock(spec=ItemRepository)
+
+
+@pytest.fixture(scope="session")
+def _user_repository_template() -> Mock:
+    return Mock(spec=UserRepository)
+
+
+@pytest.fixture(scope="session")
+def _item_service_template() -> AsyncMock:
+    return AsyncMock(spec=ItemService)
+
 
 @pytest.fixture
-def mock_item_repository() -> MagicMock:
+def mock_item_repository(_item_repository_template: Mock) -> Mock:
     """Pytest fixture that provides a mock ItemRepository.
 
     Returns:
-        A MagicMock instance configured to spec ItemRepository.
+        A freshly reset Mock instance configured to spec ItemRepository.
     """
-    return MagicMock(spec=ItemRepository)
+    return _reset(_item_repository_template)
 
 
 @pytest.fixture
-def mock_user_repository() -> MagicMock:
+def mock_user_repository(_user_repository_template: Mock) -> Mock:
     """Pytest fixture that provides a mock UserRepository.
 
     Returns:
-        A MagicMock instance configured to spec UserRepository.
+        A freshly reset Mock instance configured to spec UserRepository.
     """
-    return MagicMock(spec=UserRepository)
+    return _reset(_user_repository_template)
 
 
 @pytest.fixture
-def mock_item_service() -> AsyncMock:
+def mock_item_service(_item_service_template: AsyncMock) -> AsyncMock:
     """Pytest fixture that provides an asynchronous mock ItemService.
 
     Returns:
-        An AsyncMock instance configured to spec ItemService.
+        A freshly reset AsyncMock instance configured to spec ItemService.
     """
-    return AsyncMock(spec=ItemService)
+    return _reset(_item_service_template)
 
 
 @pytest.fixture
-def mock_db_session() -> MagicMock:
-    """Pytest fixture that provides a mock SQLAlchemy Session.
+def make_user() -> Callable[..., User]:
+    """Pytest fixture that provides a factory for User entities.
+
+    The factory fills in a default for every field, so tests only pass the
+    fields they care about. Each user gets a fresh id and an empty cart.
+
+    Returns:
+        A function accepting User fields as keyword arguments.
+    """
+
+    def make(**fields) -> User:
+        defaults = {
+            "id": uuid4(),
+            "email": "john.doe@example.com",
+            "first_name": "John",
+            "last_name": "Doe",
+            "hashed_password": "hashed_password",
+            "shipping_address": None,
+            "cart_items": [],
+        }
+        return User(**{**defaults, **fields})
+
+    return make
+
+
+@pytest.fixture
+def make_cart_item() -> Callable[..., CartItem]:
+    """Pytest fixture that provides a factory for CartItem entities.
+
+    Returns:
+        A function accepting CartItem fields as keyword arguments, with fresh
+        user and item ids and a quantity of 2 by default.
+    """
+
+    def make(**fields) -> CartItem:
+        defaults = {"user_id": uuid4(), "item_id": uuid4(), "quantity": 2}
+        return CartItem(**{**defaults, **fields})
+
+    return make
+
+
+@pytest.fixture
+def make_item() -> Callable[..., Item]:
+    """Pytest fixture that provides a factory for Item entities.
+
+    Returns:
+        A function accepting Item fields as keyword arguments, with a default
+        for every field and a fresh id for each item.
+    """
+
+    def make(**fields) -> Item:
+        defaults = {
+            "id": uuid4(),
+            "name": "Test Item",
+            "description": "A test item",
+            "price_cents": 1999,
+            "quantity": 10,
+        }
+        return Item(**{**defaults, **fields})
+
+    return make
+
+
+@pytest.fixture(scope="session")
+def event_loop() -> Iterator[asyncio.AbstractEventLoop]:
+    """Overrides pytest-asyncio's event loop to share one across the session.
+
+    The async tests only await mocks and worker threads, so nothing they do
+    outlives the test. Sharing the loop saves creating and closing one per
+    test.
+
+    Yields:
+        The event loop every async test runs on.
+    """
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="session")
+def engine() -> Engine:
+    """Pytest fixture that provides an in-memory SQLite engine with the schema.
+
+    `StaticPool` hands out a single connection, so the in-memory database
+    lives for the whole test session.
 
     Returns:
-        A MagicMock instance configured to spec sqlalchemy.orm.Session.
+        A SQLAlchemy Engine whose database has every table created.
     """
-    return MagicMock(spec=Session)
+    engine = create_engine(
+        "sqlite://",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+
+    # pysqlite's own transaction handling breaks SAVEPOINT; let SQLAlchemy
+    # emit BEGIN itself instead.
+    @event.listens_for(engine, "connect")
+    def disable_pysqlite_transactions(dbapi_connection, _connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def emit_begin(connection):
+        connection.exec_driver_sql("BEGIN")
+
+    Base.metadata.create_all(engine)
+    return engine
+
+
+@pytest.fixture
+def db_session(engine: Engine) -> Iterator[Session]:
+    """Pytest fixture that provides a Session on the SQLite test database.
+
+    The test runs inside an outer transaction that is rolled back afterwards.
+    Commits made by the code under test only release savepoints, so no data
+    leaks between tests.
+
+    Yields:
+        A SQLAlchemy Session bound to the test transaction.
+    """
+    with engine.connect() as connection:
+        transaction = connection.begin()
+        session = Session(bind=connection, join_transaction_mode="create_savepoint")
+        try:
+            yield session
+        finally:
+            session.close()
+            transaction.rollback()
+
+
+@pytest.fixture
+def sql_statements(engine: Engine) -> Iterator[list[str]]:
+    """Pytest fixture that records the SQL statements sent to the test database.
+
+    Transaction-control statements are left out, so only the queries and
+    writes issued by the code under test are recorded.
+
+    Yields:
+        The list of recorded statements, appended to as they are executed.
+    """
+    statements: list[str] = []
+
+    def record(_connection, _cursor, statement, *_args):
+        if not statement.startswith(TRANSACTION_CONTROL):
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(engine, "before_cursor_execute", record)
@@ -0,0 +1,63 @@
+from unittest.mock import MagicMock
+import pytest
+from be_task_ca.app import cache as cache_module
+from be_task_ca.app.cache import TTLCache
+
+
+class TestTTLCache:
+    @pytest.fixture(autouse=True)
+    def setup(self, monkeypatch):
+        self.now = 100.0
+        monkeypatch.setattr(cache_module.time, "monotonic", lambda: self.now)
+        self.cache = TTLCache(ttl=5)
+
+    def test_hit_within_ttl(self):
+        # Arrange
+        factory = MagicMock(return_value=b"payload")
+
+        # Act
+        first = self.cache.get_or_set("key", factory)
+        self.now += 4
+        second = self.cache.get_or_set("key", factory)
+
+        # Assert
+        assert first == second == b"payload"
+        factory.assert_called_once()
+
+    def test_miss_after_ttl(self):
+        # Arrange
+        factory = MagicMock(side_effect=[b"old", b"new"])
+
+        # Act
+        self.cache.get_or_set("key", factory)
+        self.now += 5
+        result = self.cache.get_or_set("key", factory)
+
+        # Assert
+        assert result == b"new"
+        assert factory.call_count == 2
+
+    def test_clear(self):
+        # Arrange
+        factory = MagicMock(side_effect=[b"old", b"new"])
+        self.cache.get_or_set("key", factory)
+
+        # Act
+        self.cache.clear()
+        result = self.cache.get_or_set("key", factory)
+
+        # Assert
+        assert result == b"new"
+
+    def test_clear_during_factory_discards_value(self):
+        # Arrange
+        def factory():
+            self.cache.clear()
+            return b"stale"
+
+        # Act
+        result = self.cache.get_or_set("key", factory)
+
+        # Assert
+        assert result == b"stale"
+        assert self.cache.get_or_set("key", lambda: b"fresh") == b"fresh"
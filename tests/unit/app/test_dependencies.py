@@ -0,0 +1,150 @@
+from unittest.mock import MagicMock
+import asyncio
+from uuid import uuid4
+import pytest
+from starlette.concurrency import run_in_threadpool
+from be_task_ca.infra.database import ScopedSession
+from be_task_ca.app.dependencies import item as item_dependencies
+from be_task_ca.app.dependencies import user as user_dependencies
+from be_task_ca.app.middleware import SessionMiddleware
+from be_task_ca.config import Settings
+from be_task_ca.infra.item.in_memory_repository import InMemoryItemRepository
+from be_task_ca.infra.item.sqlalchemy_repository import SQLAlchemyItemRepository
+from be_task_ca.infra.user.in_memory_repository import InMemoryUserRepository
+from be_task_ca.infra.user.sqlalchemy_repository import SQLAlchemyUserRepository
+
+
+class TestSessionMiddleware:
+    @pytest.fixture(autouse=True)
+    def setup(self, monkeypatch):
+        self.session_factory = MagicMock()
+        monkeypatch.setattr(ScopedSession.registry, "createfunc", self.session_factory)
+
+    async def test_shares_and_closes_one_session_per_request(self):
+        # Arrange
+        sessions = []
+
+        async def app(_scope, _receive, _send):
+            sessions.extend([await run_in_threadpool(ScopedSession), ScopedSession()])
+
+        # Act
+        await SessionMiddleware(app)({"type": "http"}, None, None)
+
+        # Assert
+        assert sessions[0] is sessions[1]
+        self.session_factory.assert_called_once()
+        sessions[0].close.assert_called_once()
+
+    async def test_concurrent_requests_get_separate_sessions(self):
+        # Arrange
+        self.session_factory.side_effect = lambda: MagicMock()
+        sessions = []
+
+        async def app(_scope, _receive, _send):
+            sessions.append(ScopedSession())
+            await asyncio.sleep(0)
+
+        # Act
+        await asyncio.gather(
+            SessionMiddleware(app)({"type": "http"}, None, None),
+            SessionMiddleware(app)({"type": "http"}, None, None),
+        )
+
+        # Assert
+        assert sessions[0] is not sessions[1]
+        assert self.session_factory.call_count == 2
+
+    async def test_does_not_open_unused_session(self):
+        # Arrange
+        async def app(scope, receive, send):
+            pass
+
+        # Act
+        await SessionMiddleware(app)({"type": "http"}, None, None)
+
+        # Assert
+        self.session_factory.assert_not_called()
+
+    async def test_scoped_repository_uses_request_session(self):
+        # Arrange
+        self.session_factory.side_effect = lambda: MagicMock(
+            **{"get.return_value": None}
+        )
+        repository = SQLAlchemyItemRepository(ScopedSession)
+        sessions = []
+
+        async def app(_scope, _receive, _send):
+            await run_in_threadpool(repository.find_by_id, uuid4())
+            sessions.append(ScopedSession())
+
+        # Act
+        await SessionMiddleware(app)({"type": "http"}, None, None)
+        await SessionMiddleware(app)({"type": "http"}, None, None)
+
+        # Assert
+        assert sessions[0] is not sessions[1]
+        for session in sessions:
+            session.get.assert_called_once()
+
+    def test_scoped_session_outside_request_scope(self):
+        # Act/Assert
+        with pytest.raises(LookupError):
+            ScopedSession()
+
+
+class TestProviders:
+    @pytest.mark.parametrize(
+        ("module", "factory", "in_memory_type", "sqlalchemy_type"),
+        [
+            (
+                item_dependencies,
+                item_dependencies._create_item_repository,
+                InMemoryItemRepository,
+                SQLAlchemyItemRepository,
+            ),
+            (
+                user_dependencies,
+                user_dependencies._create_user_repository,
+                InMemoryUserRepository,
+                SQLAlchemyUserRepository,
+            ),
+        ],
+    )
+    def test_create_repository_uses_configured_backend(
+        self, module, factory, in_memory_type, sqlalchemy_type, monkeypatch
+    ):
+        # Act
+        monkeypatch.setattr(module, "settings", Settings(repository_type="in_memory"))
+        in_memory = factory()
+        monkeypatch.setattr(module, "settings", Settings(repository_type="sqlalchemy"))
+        sqlalchemy = factory()
+
+        # Assert
+        assert isinstance(in_memory, in_memory_type)
+        assert isinstance(sqlalchemy, sqlalchemy_type)
+        assert sqlalchemy.db is ScopedSession
+
+    @pytest.mark.parametrize(
+        ("factory", "collaborators"),
+        [
+            (item_dependencies.get_create_item_use_case, 1),
+            (item_dependencies.get_all_items_use_case, 1),
+            (user_dependencies.get_create_user_use_case, 1),
+            (user_dependencies.get_add_item_to_cart_use_case, 2),
+            (user_dependencies.get_list_all_items_in_cart_use_case, 1),
+        ],
+    )
+    def test_use_case_is_cached_per_collaborators(self, factory, collaborators):
+        # Arrange
+        first = [MagicMock() for _ in range(collaborators)]
+        second = [MagicMock() for _ in range(collaborators)]
+
+        # Act
+        use_case = factory(*first)
+        cached = factory(*first)
+        rebuilt = factory(*second)
+        factory.cache_clear()
+
+        # Assert
+        assert use_case is cached
+        assert use_case is not rebuilt
@@ -0,0 +1,11 @@
+import pytest
+from be_task_ca.app import main  # noqa: F401
+from be_task_ca.infra.item.models import ItemModel
+from be_task_ca.infra.user.models import CartItemModel, UserModel
+
+
+class TestMain:
+    @pytest.mark.parametrize("model", [ItemModel, UserModel, CartItemModel])
+    def test_mappers_are_configured_at_startup(self, model):
+        # Assert
+        assert model.__mapper__.configured
@@ -0,0 +1,43 @@
+import json
+from uuid import uuid4
+import pytest
+from be_task_ca.app.responses import _stream_json_list, json_response
+from be_task_ca.domain.user.schema import (
+    AddToCartRequest,
+    AddToCartResponse,
+    CreateUserResponse,
+)
+
+
+class TestStreamJsonList:
+    @pytest.mark.parametrize("count", [0, 1, 3])
+    def test_matches_model_json(self, count):
+        # Arrange
+        items = [AddToCartRequest(item_id=uuid4(), quantity=1) for _ in range(count)]
+
+        # Act
+        body = b"".join(_stream_json_list("items", items))
+
+        # Assert
+        assert json.loads(body) == json.loads(AddToCartResponse(items=items).json())
+
+
+class TestJsonResponse:
+    @pytest.mark.parametrize(
+        ("exclude_none", "expected"), [(False, True), (True, False)]
+    )
+    def test_exclude_none(self, exclude_none, expected):
+        # Arrange
+        model = CreateUserResponse(
+            id=uuid4(),
+            first_name="John",
+            last_name="Doe",
+            email="john.doe@example.com",
+            shipping_address=None,
+        )
+
+        # Act
+        response = json_response(model, exclude_none=exclude_none)
+
+        # Assert
+        assert ("shipping_address" in json.loads(response.body)) is expected
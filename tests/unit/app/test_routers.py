@@ -0,0 +1,29 @@
+import pytest
+from be_task_ca.app.routers.user import _error_status
+from be_task_ca.domain.user.usecases import (
+    InsufficientStockError,
+    ItemAlreadyInCartError,
+    ItemNotFoundError,
+    UserAlreadyExistsError,
+    UserNotFoundError,
+)
+
+
+class TestErrorStatus:
+    @pytest.mark.parametrize(
+        ("error", "expected_status"),
+        [
+            (UserAlreadyExistsError("exists"), 409),
+            (UserNotFoundError("missing"), 404),
+            (ItemNotFoundError("missing"), 404),
+            (InsufficientStockError("stock"), 422),
+            (ItemAlreadyInCartError("in cart"), 409),
+            (ValueError("other"), 409),
+        ],
+    )
+    def test_error_status(self, error, expected_status):
+        # Act
+        status_code = _error_status(error)
+
+        # Assert
+        assert status_code == expected_status
@@ -0,0 +1,41 @@
+from unittest.mock import MagicMock
+import logging
+import pytest
+from be_task_ca.infra.database import _PoolOverflowMonitor
+
+
+class TestPoolOverflowMonitor:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.pool = MagicMock()
+        self.monitor = _PoolOverflowMonitor(self.pool)
+
+    def test_logs_only_overflow_transitions(self, caplog):
+        # Arrange
+        self.pool.overflow.return_value = 1
+
+        # Act
+        with caplog.at_level(logging.INFO, logger="be_task_ca.infra.database"):
+            self.monitor.on_checkout()
+            self.monitor.on_checkout()
+            self.pool.overflow.return_value = 0
+            self.monitor.on_checkin()
+
+        # Assert
+        assert [record.levelno for record in caplog.records] == [
+            logging.WARNING,
+            logging.INFO,
+        ]
+        assert self.monitor.overflowing is False
+
+    def test_no_log_within_pool_size(self, caplog):
+        # Arrange
+        self.pool.overflow.return_value = -3
+
+        # Act
+        with caplog.at_level(logging.INFO, logger="be_task_ca.infra.database"):
+            self.monitor.on_checkout()
+            self.monitor.on_checkin()
+
+        # Assert
+        assert caplog.records == []
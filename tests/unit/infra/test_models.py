@@ -0,0 +1,43 @@
+from sqlalchemy import BigInteger
+import pytest
+from be_task_ca.infra.item.models import ItemModel
+from be_task_ca.infra.user.models import CartItemModel, UserModel
+
+
+class TestModels:
+    @pytest.mark.parametrize("model", [ItemModel, UserModel])
+    def test_primary_key_has_no_extra_index(self, model):
+        # Arrange
+        table = model.__table__
+
+        # Act
+        indexed_columns = {
+            column.name for index in table.indexes for column in index.columns
+        }
+
+        # Assert
+        assert "id" not in indexed_columns
+
+    def test_item_price_is_stored_as_bigint_cents(self):
+        # Arrange/Act
+        column = ItemModel.__table__.c.price_cents
+
+        # Assert
+        assert isinstance(column.type, BigInteger)
+
+    def test_cart_items_have_covering_index_by_user(self):
+        # Arrange
+        table = CartItemModel.__table__
+
+        # Act
+        indexes = {
+            index.name: [column.name for column in index.columns]
+            for index in table.indexes
+        }
+
+        # Assert
+        assert indexes["ix_cart_items_user_covering"] == [
+            "user_id",
+            "item_id",
+            "quantity",
+        ]
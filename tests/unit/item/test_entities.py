@@ -1,6 +1,7 @@
+from dataclasses import FrozenInstanceError
 from uuid import UUID, uuid4
 import pytest
-from be_task_ca.domain.item.entities import Item
+from be_task_ca.domain.item.entities import Item, price_to_cents
 from decimal import Decimal
 
 
@@ -11,7 +12,7 @@ class TestItemEntity:
             "id": uuid4(),
             "name": "Test Item",
             "description": "A test item",
-            "price": Decimal("10.0"),
+            "price_cents": 1000,
             "quantity": 5,
         }
 
@@ -23,7 +24,8 @@ class TestItemEntity:
         assert item.id == item_data["id"]
         assert item.name == item_data["name"]
         assert item.description == item_data["description"]
-        assert item.price == item_data["price"]
+        assert item.price_cents == item_data["price_cents"]
+        assert item.price == Decimal("10.00")
         assert item.quantity == item_data["quantity"]
 
     def test_item_null_description(self, item_data):
@@ -38,31 +40,38 @@ class TestItemEntity:
 
     def test_item_negative_price(self, item_data):
         # Arrange
-        item_data["price"] = Decimal("-1.0")
+        item_data["price_cents"] = -100
 
         # Act/Assert
-        with pytest.raises(ValueError) as exc:
+        with pytest.raises(ValueError, match="^Price cannot be negative$"):
             Item(**item_data)
-        assert str(exc.value) == "Price cannot be negative"
 
     def test_item_negative_quantity(self, item_data):
         # Arrange
         item_data["quantity"] = -1
 
         # Act/Assert
-        with pytest.raises(ValueError) as exc:
+        with pytest.raises(ValueError, match="^Quantity cannot be negative$"):
             Item(**item_data)
-        assert str(exc.value) == "Quantity cannot be negative"
 
     def test_item_zero_price(self, item_data):
         # Arrange
-        item_data["price"] = Decimal("0.0")
+        item_data["price_cents"] = 0
 
         # Act
         item = Item(**item_data)
 
         # Assert
-        assert item.price == Decimal("0.0")
+        assert item.price_cents == 0
+        assert item.price == Decimal("0")
+
+    def test_item_is_immutable(self, item_data):
+        # Arrange
+        item = Item(**item_data)
+
+        # Act/Assert
+        with pytest.raises(FrozenInstanceError):
+            item.quantity = 0
 
     def test_item_zero_quantity(self, item_data):
         # Arrange
@@ -73,3 +82,13 @@ class TestItemEntity:
 
         # Assert
         assert item.quantity == 0
+
+
+class TestPriceToCents:
+    @pytest.mark.parametrize(
+        ("price", "expected"),
+        [(Decimal("19.99"), 1999), (Decimal("10.0"), 1000), (Decimal("0"), 0)],
+    )
+    def test_price_to_cents(self, price, expected):
+        # Act/Assert
+        assert price_to_cents(price) == expected
@@ -1,6 +1,8 @@
-from unittest.mock import MagicMock
+from dataclasses import replace
 from uuid import uuid4
 import pytest
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
 from be_task_ca.infra.item.sqlalchemy_repository import SQLAlchemyItemRepository
 from be_task_ca.infra.item.in_memory_repository import InMemoryItemRepository
 from be_task_ca.domain.item.entities import Item
@@ -10,113 +12,86 @@ from decimal import Decimal
 
 class TestSQLAlchemyItemRepository:
     @pytest.fixture(autouse=True)
-    def setup(self, mock_db_session):
-        self.db = mock_db_session
+    def setup(self, db_session):
+        self.db = db_session
         self.repository = SQLAlchemyItemRepository(self.db)
 
-    def test_save_new_item(self):
-        item = Item(
-            id=uuid4(),
-            name="Test Item",
-            description="A test item",
-            quantity=10,
-            price=Decimal("19.99"),
-        )
-        self.db.query.return_value.filter.return_value.first.return_value = None
-        self.db.add = MagicMock()
-        self.db.commit = MagicMock()
+    def test_save_new_item(self, make_item):
+        item = make_item()
         result = self.repository.save(item)
         assert result == item
-        self.db.add.assert_called_once()
-        self.db.commit.assert_called_once()
-        assert isinstance(self.db.add.call_args[0][0], ItemModel)
-        assert self.db.add.call_args[0][0].price == Decimal("19.99")
+        db_item = self.db.get(ItemModel, item.id)
+        assert db_item is not None
+        assert db_item.name == "Test Item"
+        assert db_item.price_cents == 1999
 
-    def test_save_existing_item(self):
+    def test_save_existing_item(self, make_item):
         item_id = uuid4()
-        item = Item(
-            id=item_id,
-            name="Test Item",
-            description="A test item",
-            quantity=10,
-            price=Decimal("19.99"),
-        )
-        db_item = ItemModel(
+        item = make_item(
             id=item_id,
             name="Old Item",
             description="Old description",
             quantity=5,
-            price=Decimal("9.99"),
+            price_cents=999,
         )
-        self.db.query.return_value.filter.return_value.first.return_value = db_item
-        self.db.commit = MagicMock()
-        result = self.repository.save(item)
-        assert result == item
-        assert db_item.name == item.name
-        assert db_item.quantity == item.quantity
-        assert db_item.price == item.price
-        self.db.commit.assert_called_once()
+        self.repository.save(item)
+        updated_item = make_item(id=item_id)
+        result = self.repository.save(updated_item)
+        assert result == updated_item
+        assert self.repository.find_by_id(item_id) == updated_item
+        assert self.db.scalar(select(func.count()).select_from(ItemModel)) == 1
 
-    def test_find_by_id_found(self):
-        item_id = uuid4()
-        db_item = ItemModel(
-            id=item_id,
-            name="Test Item",
-            description="A test item",
-            quantity=10,
-            price=Decimal("19.99"),
+    def test_save_duplicate_name(self, make_item):
+        item = make_item()
+        self.repository.save(item)
+        duplicate = make_item(
+            description="Another test item", quantity=1, price_cents=999
         )
-        self.db.query.return_value.filter.return_value.first.return_value = db_item
-        result = self.repository.find_by_id(item_id)
-        assert isinstance(result, Item)
-        assert result.id == item_id
-        assert result.name == "Test Item"
-        assert result.price == Decimal("19.99")
-        self.db.query.assert_called_with(ItemModel)
-
-    def test_find_by_id_not_found(self):
+        with pytest.raises(ValueError, match="^An item with this name already exists$"):
+            self.repository.save(duplicate)
+        assert self.repository.find_by_id(duplicate.id) is None
+        assert self.repository.find_by_id(item.id) == item
+
+    def test_save_other_integrity_error(self, make_item):
+        item = make_item(name=None)
+        with pytest.raises(IntegrityError):
+            self.repository.save(item)
+        assert self.repository.find_by_id(item.id) is None
+
+    @pytest.mark.parametrize("found", [True, False])
+    def test_find_by_id(self, found, make_item):
         item_id = uuid4()
-        self.db.query.return_value.filter.return_value.first.return_value = None
-        result = self.repository.find_by_id(item_id)
-        assert result is None
-        self.db.query.assert_called_with(ItemModel)
-
-    def test_find_by_name_found(self):
-        db_item = ItemModel(
-            id=uuid4(),
-            name="Test Item",
-            description="A test item",
-            quantity=10,
-            price=Decimal("19.99"),
-        )
-        self.db.query.return_value.filter.return_value.first.return_value = db_item
-        result = self.repository.find_by_name("Test Item")
-        assert isinstance(result, Item)
-        assert result.name == "Test Item"
-        assert result.price == Decimal("19.99")
-        self.db.query.assert_called_with(ItemModel)
-
-    def test_find_by_name_not_found(self):
-        self.db.query.return_value.filter.return_value.first.return_value = None
-        result = self.repository.find_by_name("Nonexistent Item")
-        assert result is None
-        self.db.query.assert_called_with(ItemModel)
-
-    def test_get_all(self):
-        db_item = ItemModel(
-            id=uuid4(),
-            name="Test Item",
-            description="A test item",
-            quantity=10,
-            price=Decimal("19.99"),
-        )
-        self.db.query.return_value.all.return_value = [db_item]
+        self.repository.save(make_item(id=item_id))
+        result = self.repository.find_by_id(item_id if found else uuid4())
+        if found:
+            assert isinstance(result, Item)
+            assert result.id == item_id
+            assert result.name == "Test Item"
+            assert result.price == Decimal("19.99")
+        else:
+            assert result is None
+
+    def test_find_by_id_uses_identity_map(self, sql_statements, make_item):
+        item = make_item()
+        self.repository.save(item)
+        # The identity map holds weak references, so keep the row loaded
+        db_item = self.db.get(ItemModel, item.id)
+        sql_statements.clear()
+        assert self.repository.find_by_id(item.id) == item
+        assert sql_statements == []
+        assert db_item.id == item.id
+
+    def test_get_all(self, make_item):
+        items = [
+            make_item(name=f"Test Item {i}", price_cents=1999 + i) for i in range(2)
+        ]
+        for item in items:
+            self.repository.save(item)
+        self.db.expunge_all()
         result = self.repository.get_all()
-        assert len(result) == 1
-        assert isinstance(result[0], Item)
-        assert result[0].name == "Test Item"
-        assert result[0].price == Decimal("19.99")
-        self.db.query.assert_called_with(ItemModel)
+        assert sorted(result, key=lambda item: item.name) == items
+        # Column tuples are read, so no ORM instances are loaded
+        assert len(self.db.identity_map) == 0
 
 
 class TestInMemoryItemRepository:
@@ -124,14 +99,8 @@ class TestInMemoryItemRepository:
     def setup(self):
         self.repository = InMemoryItemRepository()
 
-    def test_save_new_item(self):
-        item = Item(
-            id=uuid4(),
-            name="Test Item",
-            description="A test item",
-            quantity=10,
-            price=Decimal("19.99"),
-        )
+    def test_save_new_item(self, make_item):
+        item = make_item()
         result = self.repository.save(item)
         assert result == item
         existing = self.repository.find_by_id(item.id)
@@ -139,22 +108,16 @@ class TestInMemoryItemRepository:
         assert existing == item
         assert existing.price == Decimal("19.99")
 
-    def test_save_existing_item(self):
+    def test_save_existing_item(self, make_item):
         item_id = uuid4()
-        item = Item(
-            id=item_id,
-            name="Test Item",
-            description="A test item",
-            quantity=10,
-            price=Decimal("19.99"),
-        )
+        item = make_item(id=item_id)
         self.repository.save(item)
-        updated_item = Item(
+        updated_item = make_item(
             id=item_id,
             name="Updated Item",
             description="Updated description",
             quantity=20,
-            price=Decimal("29.99"),
+            price_cents=2999,
         )
         result = self.repository.save(updated_item)
         assert result == updated_item
@@ -164,59 +127,46 @@ class TestInMemoryItemRepository:
         assert existing.quantity == 20
         assert existing.price == Decimal("29.99")
 
-    def test_find_by_id_found(self):
-        item_id = uuid4()
-        item = Item(
-            id=item_id,
-            name="Test Item",
-            description="A test item",
-            quantity=10,
-            price=Decimal("19.99"),
-        )
+    def test_save_rename_releases_old_name(self, make_item):
+        item = make_item()
+        self.repository.save(item)
+        item = replace(item, name="Renamed Item")
         self.repository.save(item)
-        result = self.repository.find_by_id(item_id)
-        assert isinstance(result, Item)
-        assert result.id == item_id
-        assert result.name == "Test Item"
-        assert result.price == Decimal("19.99")
+        other = make_item(description="Another test item", quantity=1, price_cents=999)
+        self.repository.save(other)
+        assert self.repository.find_by_id(item.id).name == "Renamed Item"
+        assert self.repository.find_by_id(other.id).name == "Test Item"
 
-    def test_find_by_id_not_found(self):
-        item_id = uuid4()
-        result = self.repository.find_by_id(item_id)
-        assert result is None
-
-    def test_find_by_name_found(self):
-        item = Item(
-            id=uuid4(),
-            name="Test Item",
-            description="A test item",
-            quantity=10,
-            price=Decimal("19.99"),
-        )
+    def test_save_duplicate_name(self, make_item):
+        item = make_item()
         self.repository.save(item)
-        result = self.repository.find_by_name("Test Item")
-        assert isinstance(result, Item)
-        assert result.name == "Test Item"
-        assert result.price == Decimal("19.99")
-
-    def test_find_by_name_not_found(self):
-        result = self.repository.find_by_name("Nonexistent Item")
-        assert result is None
-
-    def test_get_all(self):
-        item1 = Item(
-            id=uuid4(),
-            name="Test Item 1",
-            description="First test item",
-            quantity=10,
-            price=Decimal("19.99"),
+        duplicate = make_item(
+            description="Another test item", quantity=1, price_cents=999
         )
-        item2 = Item(
-            id=uuid4(),
+        with pytest.raises(ValueError, match="^An item with this name already exists$"):
+            self.repository.save(duplicate)
+        assert self.repository.find_by_id(duplicate.id) is None
+
+    @pytest.mark.parametrize("found", [True, False])
+    def test_find_by_id(self, found, make_item):
+        item_id = uuid4()
+        self.repository.save(make_item(id=item_id))
+        result = self.repository.find_by_id(item_id if found else uuid4())
+        if found:
+            assert isinstance(result, Item)
+            assert result.id == item_id
+            assert result.name == "Test Item"
+            assert result.price == Decimal("19.99")
+        else:
+            assert result is None
+
+    def test_get_all(self, make_item):
+        item1 = make_item(name="Test Item 1", description="First test item")
+        item2 = make_item(
             name="Test Item 2",
             description="Second test item",
             quantity=20,
-            price=Decimal("29.99"),
+            price_cents=2999,
         )
         self.repository.save(item1)
         self.repository.save(item2)
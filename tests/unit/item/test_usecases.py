@@ -9,6 +9,8 @@ from be_task_ca.domain.item.schema import (
 )
 from decimal import Decimal
 
+PRICE = Decimal("10.0")
+
 
 class TestCreateItemUseCase:
     @pytest.fixture(autouse=True)
@@ -16,52 +18,72 @@ class TestCreateItemUseCase:
         self.item_repository = mock_item_repository
         self.use_case = CreateItemUseCase(self.item_repository)
 
-    @pytest.fixture
-    def create_item_request(self):
-        return CreateItemRequest(
-            name="Test Item", description=None, price=Decimal("10.0"), quantity=5
+    @pytest.fixture(scope="module")
+    def create_item_request(self, request):
+        fields = getattr(
+            request,
+            "param",
+            {"name": "Test Item", "description": None, "price": PRICE, "quantity": 5},
         )
-
-    def test_execute_success(self, create_item_request):
+        return CreateItemRequest(**fields)
+
+    @pytest.mark.parametrize(
+        ("create_item_request", "price_cents"),
+        [
+            pytest.param(
+                {
+                    "name": "Test Item",
+                    "description": None,
+                    "price": PRICE,
+                    "quantity": 5,
+                },
+                1000,
+                id="no_description",
+            ),
+            pytest.param(
+                {
+                    "name": "Bulk Item",
+                    "description": "A test item",
+                    "price": Decimal("0.99"),
+                    "quantity": 1_000_000,
+                },
+                99,
+                id="sub_unit_price",
+            ),
+            pytest.param(
+                {"name": "Free Item", "description": "", "price": 0, "quantity": 0},
+                0,
+                id="free_out_of_stock",
+            ),
+        ],
+        indirect=["create_item_request"],
+    )
+    def test_execute_success(self, create_item_request, price_cents):
         # Arrange
-        item = Item(
-            id=uuid4(),
-            name="Test Item",
-            description=None,
-            price=Decimal("10.0"),
-            quantity=5,
-        )
-        self.item_repository.find_by_name.return_value = None
-        self.item_repository.save.return_value = item
+        self.item_repository.save.side_effect = lambda item: item
 
         # Act
         result = self.use_case.execute(create_item_request)
 
         # Assert
         assert isinstance(result, CreateItemResponse)
-        assert result.name == "Test Item"
-        assert result.price == Decimal("10.0")
-        assert result.quantity == 5
-        self.item_repository.find_by_name.assert_called_once_with("Test Item")
+        assert result.name == create_item_request.name
+        assert result.description == create_item_request.description
+        assert result.price == create_item_request.price
+        assert result.quantity == create_item_request.quantity
         self.item_repository.save.assert_called_once()
+        assert self.item_repository.save.call_args[0][0].price_cents == price_cents
 
     def test_execute_conflict(self, create_item_request):
         # Arrange
-        existing_item = Item(
-            id=uuid4(),
-            name="Test Item",
-            description=None,
-            price=Decimal("10.0"),
-            quantity=5,
+        self.item_repository.save.side_effect = ValueError(
+            "An item with this name already exists"
         )
-        self.item_repository.find_by_name.return_value = existing_item
 
         # Act/Assert
-        with pytest.raises(ValueError) as exc:
+        with pytest.raises(ValueError, match="^An item with this name already exists$"):
             self.use_case.execute(create_item_request)
-        assert str(exc.value) == "An item with this name already exists"
-        self.item_repository.find_by_name.assert_called_once_with("Test Item")
-        self.item_repository.save.assert_not_called()
+        self.item_repository.save.assert_called_once()
 
 
 class TestGetAllItemsUseCase:
@@ -70,21 +92,11 @@ class TestGetAllItemsUseCase:
         self.item_repository = mock_item_repository
         self.use_case = GetAllItemsUseCase(self.item_repository)
 
-    def test_execute_success(self):
+    def test_execute_success(self, make_item):
         # Arrange
-        item1 = Item(
-            id=uuid4(),
-            name="Item 1",
-            description=None,
-            price=Decimal("10.0"),
-            quantity=5,
-        )
-        item2 = Item(
-            id=uuid4(),
-            name="Item 2",
-            description="Desc",
-            price=Decimal("20.0"),
-            quantity=3,
+        item1 = make_item(name="Item 1", description=None, price_cents=1000, quantity=5)
+        item2 = make_item(
+            name="Item 2", description="Desc", price_cents=2000, quantity=3
         )
         self.item_repository.get_all.return_value = [item1, item2]
 
@@ -109,3 +121,17 @@ class TestGetAllItemsUseCase:
         assert isinstance(result, AllItemsResponse)
         assert len(result.items) == 0
         self.item_repository.get_all.assert_called_once()
+
+    def test_stream(self, make_item):
+        # Arrange
+        item = make_item(name="Item 1", description=None, price_cents=1000, quantity=5)
+        self.item_repository.get_all.return_value = iter([item])
+
+        # Act
+        result = list(self.use_case.stream())
+
+        # Assert
+        assert len(result) == 1
+        assert isinstance(result[0], CreateItemResponse)
+        assert result[0].id == item.id
+        self.item_repository.get_all.assert_called_once()
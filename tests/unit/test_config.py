@@ -0,0 +1,31 @@
+from be_task_ca.config import Settings
+
+
+class TestSettings:
+    def test_from_env_defaults(self, monkeypatch):
+        # Arrange
+        for name in [
+            "REPOSITORY_TYPE",
+            "DATABASE_URL",
+            "DB_POOL_SIZE",
+            "DB_MAX_OVERFLOW",
+            "SQL_LOG_LEVEL",
+            "ITEMS_CACHE_TTL",
+            "ITEM_SERVICE_CACHE_TTL",
+        ]:
+            monkeypatch.delenv(name, raising=False)
+
+        # Act/Assert
+        assert Settings.from_env() == Settings()
+
+    def test_from_env_overrides(self, monkeypatch):
+        # Arrange
+        monkeypatch.setenv("REPOSITORY_TYPE", "in_memory")
+        monkeypatch.setenv("DB_POOL_SIZE", "3")
+
+        # Act
+        settings = Settings.from_env()
+
+        # Assert
+        assert settings.repository_type == "in_memory"
+        assert settings.db_pool_size == 3
@@ -4,7 +4,7 @@ from be_task_ca.domain.user.entities import User, CartItem
 
 
 class TestUserEntity:
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def user_data(self):
         return {
             "id": uuid4(),
@@ -32,28 +32,64 @@ class TestUserEntity:
     def test_user_with_cart_items(self, user_data):
         # Arrange
         cart_item = CartItem(user_id=user_data["id"], item_id=uuid4(), quantity=2)
-        user_data["cart_items"] = [cart_item]
+        data = {**user_data, "cart_items": [cart_item]}
 
         # Act
-        user = User(**user_data)
+        user = User(**data)
 
         # Assert
         assert len(user.cart_items) == 1
         assert user.cart_items[0].quantity == 2
 
+    def test_user_has_cart_item(self, user_data):
+        # Arrange
+        cart_item = CartItem(user_id=user_data["id"], item_id=uuid4(), quantity=2)
+        data = {**user_data, "cart_items": [cart_item]}
+
+        # Act
+        user = User(**data)
+
+        # Assert
+        assert user.has_cart_item(cart_item.item_id)
+        assert not user.has_cart_item(uuid4())
+
+    def test_user_add_cart_item(self, user_data):
+        # Arrange
+        # add_cart_item appends in place, so the shared fixture list is not passed.
+        user = User(**{**user_data, "cart_items": []})
+        cart_item = CartItem(user_id=user.id, item_id=uuid4(), quantity=1)
+
+        # Act
+        user.add_cart_item(cart_item)
+
+        # Assert
+        assert user.cart_items == [cart_item]
+        assert user.has_cart_item(cart_item.item_id)
+
+    def test_user_model_dump(self, user_data):
+        # Arrange
+        cart_item = CartItem(user_id=user_data["id"], item_id=uuid4(), quantity=2)
+        user = User(**{**user_data, "cart_items": [cart_item]})
+
+        # Act
+        result = user.model_dump()
+
+        # Assert
+        assert result == {**user_data, "cart_items": [cart_item.model_dump()]}
+
     def test_user_null_shipping_address(self, user_data):
         # Arrange
-        user_data["shipping_address"] = None
+        data = {**user_data, "shipping_address": None}
 
         # Act
-        user = User(**user_data)
+        user = User(**data)
 
         # Assert
         assert user.shipping_address is None
 
 
 class TestCartItemEntity:
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def cart_item_data(self):
         return {"user_id": uuid4(), "item_id": uuid4(), "quantity": 2}
 
@@ -68,8 +104,15 @@ class TestCartItemEntity:
 
     def test_cart_item_invalid_quantity(self, cart_item_data):
         # Arrange
-        cart_item_data["quantity"] = 0
+        data = {**cart_item_data, "quantity": 0}
+
+        # Act/Assert
+        with pytest.raises(ValueError, match="^Quantity must be positive$"):
+            CartItem(**data)
+
+    def test_cart_item_model_dump(self, cart_item_data):
+        # Arrange
+        cart_item = CartItem(**cart_item_data)
 
         # Act/Assert
-        with pytest.raises(ValueError):
-            CartItem(**cart_item_data)
+        assert cart_item.model_dump() == cart_item_data
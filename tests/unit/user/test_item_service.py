@@ -0,0 +1,111 @@
+from uuid import uuid4
+import pytest
+from be_task_ca.infra.user import cached_item_service as cached_module
+from be_task_ca.infra.user.cached_item_service import CachedItemService
+from be_task_ca.infra.user.item_service import MockItemService
+
+
+class TestMockItemService:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.service = MockItemService()
+
+    async def test_get_item_with_stock_available(self):
+        # Arrange
+        item_id = uuid4()
+
+        # Act
+        item, in_stock = await self.service.get_item_with_stock(item_id, 12)
+
+        # Assert
+        assert item["id"] == item_id
+        assert in_stock is True
+
+    async def test_get_item_with_stock_insufficient(self):
+        # Act
+        item, in_stock = await self.service.get_item_with_stock(uuid4(), 13)
+
+        # Assert
+        assert item is not None
+        assert in_stock is False
+
+    async def test_check_stock_does_not_call_get_item(self, monkeypatch):
+        # Arrange
+        async def fail(_item_id):
+            raise AssertionError("get_item should not be called")
+
+        monkeypatch.setattr(self.service, "get_item", fail)
+
+        # Act
+        in_stock = await self.service.check_stock(uuid4(), 12)
+
+        # Assert
+        assert in_stock is True
+
+
+class TestCachedItemService:
+    @pytest.fixture(autouse=True)
+    def setup(self, monkeypatch, mock_item_service):
+        self.now = 100.0
+        monkeypatch.setattr(cached_module.time, "monotonic", lambda: self.now)
+        self.inner = mock_item_service
+        self.service = CachedItemService(self.inner, ttl=5, maxsize=2)
+
+    async def test_hit_within_ttl(self):
+        # Arrange
+        item_id = uuid4()
+        self.inner.get_item_with_stock.return_value = ({"id": item_id}, True)
+
+        # Act
+        first = await self.service.get_item_with_stock(item_id, 1)
+        self.now += 4
+        second = await self.service.get_item_with_stock(item_id, 1)
+
+        # Assert
+        assert first == second == ({"id": item_id}, True)
+        self.inner.get_item_with_stock.assert_called_once_with(item_id, 1)
+
+    async def test_miss_after_ttl(self):
+        # Arrange
+        item_id = uuid4()
+        self.inner.get_item_with_stock.side_effect = [
+            ({"id": item_id}, True),
+            ({"id": item_id}, False),
+        ]
+
+        # Act
+        await self.service.get_item_with_stock(item_id, 1)
+        self.now += 5
+        result = await self.service.get_item_with_stock(item_id, 1)
+
+        # Assert
+        assert result == ({"id": item_id}, False)
+        assert self.inner.get_item_with_stock.call_count == 2
+
+    async def test_missing_item_not_cached(self):
+        # Arrange
+        item_id = uuid4()
+        self.inner.get_item_with_stock.return_value = (None, False)
+
+        # Act
+        await self.service.get_item_with_stock(item_id, 1)
+        await self.service.get_item_with_stock(item_id, 1)
+
+        # Assert
+        assert self.inner.get_item_with_stock.call_count == 2
+
+    async def test_evicts_oldest_beyond_maxsize(self):
+        # Arrange
+        item_ids = [uuid4(), uuid4(), uuid4()]
+        self.inner.get_item_with_stock.side_effect = lambda item_id, quantity: (
+            {"id": item_id},
+            True,
+        )
+
+        # Act
+        for item_id in item_ids:
+            await self.service.get_item_with_stock(item_id, 1)
+        await self.service.get_item_with_stock(item_ids[0], 1)
+
+        # Assert
+        assert self.inner.get_item_with_stock.call_count == 4
@@ -0,0 +1,36 @@
+import pytest
+from be_task_ca.domain.user.passwords import hash_password, verify_password
+
+
+class TestPasswords:
+    @pytest.fixture(scope="class")
+    def hashed_password(self):
+        return hash_password("password")
+
+    def test_hash_is_salted(self, hashed_password):
+        # Arrange/Act
+        other = hash_password("password")
+
+        # Assert
+        assert other != hashed_password
+        assert "password" not in hashed_password
+
+    def test_hash_uses_scrypt(self, hashed_password):
+        assert hashed_password.startswith("scrypt$16384,8,1$")
+
+    def test_verify_correct_password(self, hashed_password):
+        assert verify_password("password", hashed_password) is True
+
+    def test_verify_wrong_password(self, hashed_password):
+        assert verify_password("wrong", hashed_password) is False
+
+    def test_verify_malformed_hash(self):
+        assert verify_password("password", "not-a-hash") is False
+
+    def test_verify_unknown_algorithm(self, hashed_password):
+        # Arrange
+        _, parameters, salt, digest = hashed_password.split("$")
+        other = f"pbkdf2_sha512${parameters}${salt}${digest}"
+
+        # Act/Assert
+        assert verify_password("password", other) is False
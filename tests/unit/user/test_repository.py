@@ -1,265 +1,237 @@
-from unittest.mock import MagicMock
 from uuid import uuid4
 import pytest
+from be_task_ca.infra.user import sqlalchemy_repository
 from be_task_ca.infra.user.sqlalchemy_repository import SQLAlchemyUserRepository
 from be_task_ca.infra.user.in_memory_repository import InMemoryUserRepository
 from be_task_ca.domain.user.entities import User, CartItem
-from be_task_ca.infra.user.models import UserModel, CartItemModel
 
 
-class TestSQLAlchemyUserRepository:
-    @pytest.fixture(autouse=True)
-    def setup(self, mock_db_session):
-        self.db = mock_db_session
-        self.repository = SQLAlchemyUserRepository(self.db)
-
-    def test_save_new_user(self):
-        user = User(
-            id=uuid4(),
-            email="john.doe@example.com",
-            first_name="John",
-            last_name="Doe",
-            hashed_password="hashed_password",
-            shipping_address=None,
-            cart_items=[],
-        )
-        self.db.query.return_value.filter.return_value.first.return_value = None
-        self.db.add = MagicMock()
-        self.db.commit = MagicMock()
-        result = self.repository.save(user)
-        assert result == user
-        self.db.add.assert_called_once()
-        self.db.commit.assert_called_once()
-        assert isinstance(self.db.add.call_args[0][0], UserModel)
-
-    def test_save_existing_user(self):
-        user_id = uuid4()
-        user = User(
-            id=user_id,
-            email="john.doe@example.com",
-            first_name="John",
-            last_name="Doe",
-            hashed_password="hashed_password",
-            shipping_address=None,
-            cart_items=[],
-        )
-        db_user = UserModel(
-            id=user_id,
-            email="old@example.com",
-            first_name="Old",
-            last_name="Name",
-            hashed_password="old_password",
-            shipping_address="Old Address",
-        )
-        self.db.query.return_value.filter.return_value.first.return_value = db_user
-        self.db.commit = MagicMock()
-        result = self.repository.save(user)
-        assert result == user
-        assert db_user.email == user.email
-        assert db_user.first_name == user.first_name
-        self.db.commit.assert_called_once()
-
-    def test_save_with_cart_items(self):
-        user_id = uuid4()
-        cart_item = CartItem(user_id=user_id, item_id=uuid4(), quantity=2)
-        user = User(
-            id=user_id,
-            email="john.doe@example.com",
-            first_name="John",
-            last_name="Doe",
-            hashed_password="hashed_password",
-            shipping_address=None,
-            cart_items=[cart_item],
-        )
-        self.db.query.return_value.filter.return_value.first.return_value = None
-        self.db.add = MagicMock()
-        self.db.commit = MagicMock()
-        self.db.query.return_value.filter.return_value.delete = MagicMock()
-        result = self.repository.save(user)
-        assert result == user
-        assert self.db.add.call_count == 2  # User and CartItem
-        self.db.commit.assert_called_once()
-        self.db.query.return_value.filter.return_value.delete.assert_called_once()
+@pytest.fixture(params=["sqlalchemy", "in_memory"])
+def user_repository(request):
+    """Pytest fixture that provides each UserRepository implementation in turn.
 
-    def test_find_by_email_found(self):
-        user_id = uuid4()
-        db_user = UserModel(
-            id=user_id,
-            email="john.doe@example.com",
-            first_name="John",
-            last_name="Doe",
-            hashed_password="hashed_password",
-            shipping_address=None,
-        )
-        self.db.query.return_value.filter.return_value.first.return_value = db_user
-        self.db.query.return_value.filter.return_value.all.return_value = []
-        result = self.repository.find_by_email("john.doe@example.com")
-        assert isinstance(result, User)
-        assert result.email == "john.doe@example.com"
-        assert result.cart_items == []
-        self.db.query.assert_any_call(UserModel)
-
-    def test_find_by_email_not_found(self):
-        self.db.query.return_value.filter.return_value.first.return_value = None
-        result = self.repository.find_by_email("john.doe@example.com")
-        assert result is None
-        self.db.query.assert_called_with(UserModel)
-
-    def test_find_by_id_found(self):
-        user_id = uuid4()
-        db_user = UserModel(
-            id=user_id,
-            email="john.doe@example.com",
-            first_name="John",
-            last_name="Doe",
-            hashed_password="hashed_password",
-            shipping_address=None,
-        )
-        self.db.query.return_value.filter.return_value.first.return_value = db_user
-        self.db.query.return_value.filter.return_value.all.return_value = []
-        result = self.repository.find_by_id(user_id)
-        assert isinstance(result, User)
-        assert result.id == user_id
-        self.db.query.assert_any_call(UserModel)
-
-    def test_find_by_id_not_found(self):
-        user_id = uuid4()
-        self.db.query.return_value.filter.return_value.first.return_value = None
-        result = self.repository.find_by_id(user_id)
-        assert result is None
-        self.db.query.assert_called_with(UserModel)
+    Returns:
+        A SQLAlchemyUserRepository on the test database, or an empty
+        InMemoryUserRepository.
+    """
+    if request.param == "sqlalchemy":
+        return SQLAlchemyUserRepository(request.getfixturevalue("db_session"))
+    return InMemoryUserRepository()
 
-    def test_find_cart_items(self):
-        user_id = uuid4()
-        db_cart_item = CartItemModel(user_id=user_id, item_id=uuid4(), quantity=2)
-        self.db.query.return_value.filter.return_value.all.return_value = [db_cart_item]
-        result = self.repository.find_cart_items(user_id)
-        assert len(result) == 1
-        assert isinstance(result[0], CartItem)
-        assert result[0].quantity == 2
-        self.db.query.assert_called_with(CartItemModel)
 
+class TestUserRepository:
+    """Behaviour shared by every UserRepository implementation."""
 
-class TestInMemoryUserRepository:
     @pytest.fixture(autouse=True)
-    def setup(self):
-        self.repository = InMemoryUserRepository()
+    def setup(self, user_repository):
+        self.repository = user_repository
 
-    def test_save_new_user(self):
-        user = User(
-            id=uuid4(),
-            email="john.doe@example.com",
-            first_name="John",
-            last_name="Doe",
-            hashed_password="hashed_password",
-            shipping_address=None,
-            cart_items=[],
-        )
+    def test_save_new_user(self, make_user):
+        user = make_user()
         result = self.repository.save(user)
         assert result == user
         assert self.repository.find_by_id(user.id) == user
 
-    def test_save_existing_user(self):
+    def test_save_existing_user(self, make_user):
         user_id = uuid4()
-        user = User(
-            id=user_id,
-            email="john.doe@example.com",
-            first_name="John",
-            last_name="Doe",
-            hashed_password="hashed_password",
-            shipping_address=None,
-            cart_items=[],
-        )
-        self.repository.save(user)
-        updated_user = User(
+        self.repository.save(make_user(id=user_id, email="old@example.com"))
+        updated_user = make_user(
             id=user_id,
             email="jane.doe@example.com",
             first_name="Jane",
-            last_name="Doe",
             hashed_password="new_password",
             shipping_address="123 Main St",
-            cart_items=[],
         )
         result = self.repository.save(updated_user)
         assert result == updated_user
-        assert self.repository.find_by_id(user_id).email == "jane.doe@example.com"
+        assert self.repository.find_by_id(user_id) == updated_user
+        assert self.repository.find_by_email("jane.doe@example.com").id == user_id
+        assert self.repository.find_by_email("old@example.com") is None
 
-    def test_save_with_cart_items(self):
+    def test_save_with_cart_items(self, make_user, make_cart_item):
         user_id = uuid4()
-        cart_item = CartItem(user_id=user_id, item_id=uuid4(), quantity=2)
-        user = User(
-            id=user_id,
-            email="john.doe@example.com",
-            first_name="John",
-            last_name="Doe",
-            hashed_password="hashed_password",
-            shipping_address=None,
-            cart_items=[cart_item],
-        )
+        cart_items = [
+            make_cart_item(user_id=user_id),
+            make_cart_item(user_id=user_id, quantity=1),
+        ]
+        user = make_user(id=user_id, cart_items=cart_items)
         result = self.repository.save(user)
         assert result == user
-        assert len(self.repository.find_cart_items(user_id)) == 1
-        assert self.repository.find_cart_items(user_id)[0].quantity == 2
-
-    def test_find_by_email_found(self):
-        user = User(
-            id=uuid4(),
-            email="john.doe@example.com",
-            first_name="John",
-            last_name="Doe",
-            hashed_password="hashed_password",
-            shipping_address=None,
-            cart_items=[],
-        )
-        self.repository.save(user)
-        result = self.repository.find_by_email("john.doe@example.com")
-        assert isinstance(result, User)
-        assert result.email == "john.doe@example.com"
-
-    def test_find_by_email_not_found(self):
-        result = self.repository.find_by_email("john.doe@example.com")
-        assert result is None
+        assert sorted(
+            self.repository.find_cart_items(user_id), key=lambda ci: ci.quantity
+        ) == sorted(cart_items, key=lambda ci: ci.quantity)
 
-    def test_find_by_id_found(self):
+    def test_save_replaces_cart_items(self, make_user, make_cart_item):
         user_id = uuid4()
-        user = User(
-            id=user_id,
-            email="john.doe@example.com",
-            first_name="John",
-            last_name="Doe",
-            hashed_password="hashed_password",
-            shipping_address=None,
-            cart_items=[],
-        )
+        kept = make_cart_item(user_id=user_id, quantity=1)
+        dropped = make_cart_item(user_id=user_id)
+        self.repository.save(make_user(id=user_id, cart_items=[kept, dropped]))
+        self.repository.save(make_user(id=user_id, cart_items=[kept]))
+        assert list(self.repository.find_cart_items(user_id)) == [kept]
+
+    def test_changes_after_save_are_not_stored(self, make_user, make_cart_item):
+        user = make_user()
         self.repository.save(user)
-        result = self.repository.find_by_id(user_id)
-        assert isinstance(result, User)
-        assert result.id == user_id
+        user.add_cart_item(make_cart_item(user_id=user.id))
+        loaded = self.repository.find_by_id(user.id)
+        loaded.add_cart_item(make_cart_item(user_id=user.id))
+        stored = self.repository.find_by_id(user.id)
+        assert stored.cart_items == []
+        assert not stored.has_cart_item(user.cart_items[0].item_id)
+        assert list(self.repository.find_cart_items(user.id)) == []
+
+    def test_add_cart_item(self, make_user, make_cart_item):
+        user = make_user()
+        self.repository.save(user)
+        cart_item = make_cart_item(user_id=user.id)
+        assert self.repository.add_cart_item(cart_item) is True
+        assert self.repository.add_cart_item(cart_item) is False
+        assert list(self.repository.find_cart_items(user.id)) == [cart_item]
 
-    def test_find_by_id_not_found(self):
+    @pytest.mark.parametrize("found", [True, False])
+    def test_find_by_email(self, found, make_user, make_cart_item):
+        user_id = uuid4()
+        cart_item = make_cart_item(user_id=user_id)
+        self.repository.save(make_user(id=user_id, cart_items=[cart_item]))
+        email = "john.doe@example.com" if found else "jane.doe@example.com"
+        result = self.repository.find_by_email(email)
+        if found:
+            assert isinstance(result, User)
+            assert result.email == "john.doe@example.com"
+            assert result.cart_items == [cart_item]
+        else:
+            assert result is None
+
+    @pytest.mark.parametrize("found", [True, False])
+    def test_find_by_id(self, found, make_user, make_cart_item):
+        user_id = uuid4()
+        cart_item = make_cart_item(user_id=user_id)
+        self.repository.save(make_user(id=user_id, cart_items=[cart_item]))
+        result = self.repository.find_by_id(user_id if found else uuid4())
+        if found:
+            assert isinstance(result, User)
+            assert result.id == user_id
+            assert len(result.cart_items) == 1
+            assert isinstance(result.cart_items[0], CartItem)
+            assert result.cart_items[0].quantity == 2
+        else:
+            assert result is None
+
+    def test_find_cart_items(self, make_user, make_cart_item):
         user_id = uuid4()
-        result = self.repository.find_by_id(user_id)
-        assert result is None
+        cart_item = make_cart_item(user_id=user_id)
+        self.repository.save(make_user(id=user_id, cart_items=[cart_item]))
+        result = list(self.repository.find_cart_items(user_id))
+        assert result == [cart_item]
 
-    def test_find_cart_items(self):
+    def test_find_cart_items_user_not_found(self):
+        result = list(self.repository.find_cart_items(uuid4()))
+        assert result == []
+
+
+class TestSQLAlchemyUserRepository:
+    """The SQL each SQLAlchemyUserRepository operation sends."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, db_session):
+        self.db = db_session
+        self.repository = SQLAlchemyUserRepository(self.db)
+
+    def test_save_new_user(self, sql_statements, make_user):
+        self.repository.save(make_user())
+        # One upsert and the cart DELETE; no existence SELECT
+        assert [statement.split()[0] for statement in sql_statements] == [
+            "INSERT",
+            "DELETE",
+        ]
+        assert "ON CONFLICT (id) DO UPDATE" in sql_statements[0]
+
+    def test_save_with_cart_items(self, sql_statements, make_user, make_cart_item):
         user_id = uuid4()
-        cart_item = CartItem(user_id=user_id, item_id=uuid4(), quantity=2)
-        user = User(
-            id=user_id,
-            email="john.doe@example.com",
-            first_name="John",
-            last_name="Doe",
-            hashed_password="hashed_password",
-            shipping_address=None,
-            cart_items=[cart_item],
-        )
+        cart_items = [
+            make_cart_item(user_id=user_id),
+            make_cart_item(user_id=user_id, quantity=1),
+        ]
+        self.repository.save(make_user(id=user_id, cart_items=cart_items))
+        # Upsert, DELETE, then one executemany INSERT for the whole cart
+        assert len(sql_statements) == 3
+        assert sql_statements[2].startswith("INSERT INTO cart_items")
+
+    def test_add_cart_item(self, sql_statements, make_user, make_cart_item):
+        user = make_user()
         self.repository.save(user)
-        result = self.repository.find_cart_items(user_id)
-        assert len(result) == 1
-        assert isinstance(result[0], CartItem)
-        assert result[0].quantity == 2
+        cart_item = make_cart_item(user_id=user.id)
+        sql_statements.clear()
+        self.repository.add_cart_item(cart_item)
+        self.repository.add_cart_item(cart_item)
+        assert len(sql_statements) == 2
+        assert "ON CONFLICT (user_id, item_id) DO NOTHING" in sql_statements[0]
+
+    def test_find_by_email_single_statement(
+        self, sql_statements, make_user, make_cart_item
+    ):
+        user_id = uuid4()
+        cart_item = make_cart_item(user_id=user_id)
+        self.repository.save(make_user(id=user_id, cart_items=[cart_item]))
+        self.db.expunge_all()
+        sql_statements.clear()
+        self.repository.find_by_email("john.doe@example.com")
+        # The user and the cart are joined in a single round-trip
+        assert len(sql_statements) == 1
+
+    def test_find_by_id_single_statement(
+        self, sql_statements, make_user, make_cart_item
+    ):
+        user_id = uuid4()
+        cart_item = make_cart_item(user_id=user_id)
+        self.repository.save(make_user(id=user_id, cart_items=[cart_item]))
+        self.db.expunge_all()
+        sql_statements.clear()
+        self.repository.find_by_id(user_id)
+        assert len(sql_statements) == 1
 
-    def test_find_cart_items_user_not_found(self):
+
+class TestSQLAlchemyUserRepositoryWithoutUpsert:
+    """The ORM fallback used on dialects without ON CONFLICT support."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, monkeypatch, db_session):
+        monkeypatch.setattr(sqlalchemy_repository, "UPSERT_INSERTS", {})
+        self.repository = SQLAlchemyUserRepository(db_session)
+
+    def test_save_new_and_existing_user(self, make_user, make_cart_item):
         user_id = uuid4()
-        result = self.repository.find_cart_items(user_id)
-        assert result == []
+        self.repository.save(make_user(id=user_id, email="old@example.com"))
+        cart_item = make_cart_item(user_id=user_id)
+        updated_user = make_user(id=user_id, first_name="Jane", cart_items=[cart_item])
+        self.repository.save(updated_user)
+        assert self.repository.find_by_id(user_id) == updated_user
+        assert self.repository.find_by_email("old@example.com") is None
+
+    def test_add_cart_item(self, make_user, make_cart_item):
+        user = make_user()
+        self.repository.save(user)
+        cart_item = make_cart_item(user_id=user.id)
+        assert self.repository.add_cart_item(cart_item) is True
+        assert self.repository.add_cart_item(cart_item) is False
+        assert list(self.repository.find_cart_items(user.id)) == [cart_item]
+
+
+class TestInMemoryUserRepository:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.repository = InMemoryUserRepository()
+
+    def test_add_cart_item_leaves_loaded_user_unchanged(
+        self, make_user, make_cart_item
+    ):
+        user = make_user()
+        self.repository.save(user)
+        loaded = self.repository.find_by_id(user.id)
+        cart_item = make_cart_item(user_id=user.id)
+        self.repository.add_cart_item(cart_item)
+        assert loaded.cart_items == []
+
+    def test_add_cart_item_user_not_found(self, make_cart_item):
+        cart_item = make_cart_item()
+        assert self.repository.add_cart_item(cart_item) is False
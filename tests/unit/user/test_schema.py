@@ -0,0 +1,40 @@
+from pydantic import ValidationError
+import pytest
+from be_task_ca.domain.user.schema import CreateUserRequest
+
+
+class TestCreateUserRequest:
+    @pytest.fixture
+    def payload(self):
+        return {
+            "first_name": "John",
+            "last_name": "Doe",
+            "email": "john.doe@example.com",
+            "password": "password",
+        }
+
+    def test_valid_payload(self, payload):
+        # Act
+        request = CreateUserRequest(**payload)
+
+        # Assert
+        assert request.email == "john.doe@example.com"
+        assert request.shipping_address is None
+
+    @pytest.mark.parametrize(
+        ("field", "value"),
+        [
+            ("email", "not-an-email"),
+            ("email", "john@doe"),
+            ("password", "short"),
+            ("first_name", "J" * 65),
+            ("shipping_address", "A" * 257),
+        ],
+    )
+    def test_invalid_field_is_rejected(self, payload, field, value):
+        # Arrange
+        payload[field] = value
+
+        # Act/Assert
+        with pytest.raises(ValidationError):
+            CreateUserRequest(**payload)
@@ -5,8 +5,15 @@ from be_task_ca.domain.user.usecases import (
     CreateUserUseCase,
     AddItemToCartUseCase,
     ListItemsInCartUseCase,
+    UserAlreadyExistsError,
+    UserNotFoundError,
+    ItemNotFoundError,
+    InsufficientStockError,
+    ItemAlreadyInCartError,
 )
 from be_task_ca.domain.user.entities import User, CartItem
+from be_task_ca.domain.user import passwords
+from be_task_ca.domain.user.passwords import verify_password
 from be_task_ca.domain.user.schema import (
     CreateUserRequest,
     CreateUserResponse,
@@ -17,11 +24,13 @@ from be_task_ca.domain.user.schema import (
 
 class TestCreateUserUseCase:
     @pytest.fixture(autouse=True)
-    def setup(self, mock_user_repository):
+    def setup(self, mock_user_repository, monkeypatch):
+        # The hash cost is covered by the password tests; keep it cheap here.
+        monkeypatch.setattr(passwords, "SCRYPT_N", 2**4)
         self.user_repository = mock_user_repository
         self.use_case = CreateUserUseCase(self.user_repository)
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def create_user_request(self):
         return CreateUserRequest(
             first_name="John",
@@ -31,53 +40,36 @@ class TestCreateUserUseCase:
             shipping_address=None,
         )
 
-    def test_execute_success(self, create_user_request):
+    @pytest.mark.parametrize("existing", [False, True], ids=["new", "conflict"])
+    def test_execute(self, create_user_request, make_user, existing):
         # Arrange
-        user = User(
-            id=uuid4(),
-            first_name="John",
-            last_name="Doe",
-            email="john.doe@example.com",
-            hashed_password="hashed_password",
-            shipping_address=None,
-            cart_items=[],
-        )
-        self.user_repository.find_by_email.return_value = None
+        user = make_user()
+        self.user_repository.find_by_email.return_value = user if existing else None
         self.user_repository.save.return_value = user
 
-        # Act
-        result = self.use_case.execute(create_user_request)
-
-        # Assert
-        assert isinstance(result, CreateUserResponse)
-        assert result.email == "john.doe@example.com"
-        assert result.first_name == "John"
-        self.user_repository.find_by_email.assert_called_once_with(
-            "john.doe@example.com"
-        )
-        self.user_repository.save.assert_called_once()
-
-    def test_execute_conflict(self, create_user_request):
-        # Arrange
-        existing_user = User(
-            id=uuid4(),
-            first_name="John",
-            last_name="Doe",
-            email="john.doe@example.com",
-            hashed_password="hashed_password",
-            shipping_address=None,
-            cart_items=[],
-        )
-        self.user_repository.find_by_email.return_value = existing_user
-
         # Act/Assert
-        with pytest.raises(ValueError) as exc:
-            self.use_case.execute(create_user_request)
-        assert str(exc.value) == "An user with this email already exists"
+        if existing:
+            with pytest.raises(
+                UserAlreadyExistsError,
+                match="^An user with this email already exists$",
+            ):
+                self.use_case.execute(create_user_request)
+        else:
+            result = self.use_case.execute(create_user_request)
+            assert isinstance(result, CreateUserResponse)
+            assert result.email == "john.doe@example.com"
+            assert result.first_name == "John"
+            assert result.id == user.id
+            assert "hashed_password" not in result.dict()
         self.user_repository.find_by_email.assert_called_once_with(
             "john.doe@example.com"
         )
-        self.user_repository.save.assert_not_called()
+        if existing:
+            self.user_repository.save.assert_not_called()
+        else:
+            self.user_repository.save.assert_called_once()
+            saved_user = self.user_repository.save.call_args[0][0]
+            assert verify_password("password", saved_user.hashed_password)
 
 
 class TestAddItemToCartUseCase:
@@ -87,28 +79,18 @@ class TestAddItemToCartUseCase:
         self.item_service = mock_item_service
         self.use_case = AddItemToCartUseCase(self.user_repository, self.item_service)
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def add_to_cart_request(self):
         return AddToCartRequest(item_id=uuid4(), quantity=2)
 
-    @pytest.mark.asyncio
-    async def test_execute_success(self, add_to_cart_request):
+    async def test_execute_success(self, add_to_cart_request, make_user):
         # Arrange
         user_id = uuid4()
-        user = User(
-            id=user_id,
-            first_name="John",
-            last_name="Doe",
-            email="john.doe@example.com",
-            hashed_password="hashed_password",
-            shipping_address=None,
-            cart_items=[],
-        )
+        user = make_user(id=user_id)
         item = {"id": add_to_cart_request.item_id, "name": "Test Item", "quantity": 5}
         self.user_repository.find_by_id.return_value = user
-        self.item_service.get_item.return_value = item
-        self.item_service.check_stock.return_value = True
-        self.user_repository.save.return_value = user
+        self.item_service.get_item_with_stock.return_value = (item, True)
+        self.user_repository.add_cart_item.return_value = True
 
         # Act
         result = await self.use_case.execute(user_id, add_to_cart_request)
@@ -119,111 +101,112 @@ class TestAddItemToCartUseCase:
         assert result.items[0].item_id == add_to_cart_request.item_id
         assert result.items[0].quantity == 2
         self.user_repository.find_by_id.assert_called_once_with(user_id)
-        self.item_service.get_item.assert_called_once_with(add_to_cart_request.item_id)
-        self.item_service.check_stock.assert_called_once_with(
+        self.item_service.get_item_with_stock.assert_called_once_with(
             add_to_cart_request.item_id, quantity=2
         )
-        self.user_repository.save.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_execute_user_not_found(self, add_to_cart_request):
-        # Arrange
-        user_id = uuid4()
-        self.user_repository.find_by_id.return_value = None
-
-        # Act/Assert
-        with pytest.raises(ValueError) as exc:
-            await self.use_case.execute(user_id, add_to_cart_request)
-        assert str(exc.value) == "User does not exists"
-        self.user_repository.find_by_id.assert_called_once_with(user_id)
-        self.item_service.get_item.assert_not_called()
-        self.item_service.check_stock.assert_not_called()
-        self.user_repository.save.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_execute_item_not_found(self, add_to_cart_request):
-        # Arrange
-        user_id = uuid4()
-        user = User(
-            id=user_id,
-            first_name="John",
-            last_name="Doe",
-            email="john.doe@example.com",
-            hashed_password="hashed_password",
-            shipping_address=None,
-            cart_items=[],
+        self.user_repository.add_cart_item.assert_called_once_with(
+            CartItem(user_id=user_id, item_id=add_to_cart_request.item_id, quantity=2)
         )
-        self.user_repository.find_by_id.return_value = user
-        self.item_service.get_item.return_value = None
-
-        # Act/Assert
-        with pytest.raises(ValueError) as exc:
-            await self.use_case.execute(user_id, add_to_cart_request)
-        assert str(exc.value) == "Item does not exists"
-        self.user_repository.find_by_id.assert_called_once_with(user_id)
-        self.item_service.get_item.assert_called_once_with(add_to_cart_request.item_id)
-        self.item_service.check_stock.assert_not_called()
         self.user_repository.save.assert_not_called()
 
-    @pytest.mark.asyncio
-    async def test_execute_insufficient_stock(self, add_to_cart_request):
+    async def test_execute_item_added_concurrently(
+        self, add_to_cart_request, make_user
+    ):
         # Arrange
         user_id = uuid4()
-        user = User(
-            id=user_id,
-            first_name="John",
-            last_name="Doe",
-            email="john.doe@example.com",
-            hashed_password="hashed_password",
-            shipping_address=None,
-            cart_items=[],
-        )
-        item = {"id": add_to_cart_request.item_id, "name": "Test Item", "quantity": 1}
+        user = make_user(id=user_id)
+        item = {"id": add_to_cart_request.item_id, "name": "Test Item", "quantity": 5}
         self.user_repository.find_by_id.return_value = user
-        self.item_service.get_item.return_value = item
-        self.item_service.check_stock.return_value = False
+        self.item_service.get_item_with_stock.return_value = (item, True)
+        self.user_repository.add_cart_item.return_value = False
 
         # Act/Assert
-        with pytest.raises(ValueError) as exc:
+        with pytest.raises(ItemAlreadyInCartError, match="^Item already in cart$"):
             await self.use_case.execute(user_id, add_to_cart_request)
-        assert str(exc.value) == "Not enough items in stock"
-        self.user_repository.find_by_id.assert_called_once_with(user_id)
-        self.item_service.get_item.assert_called_once_with(add_to_cart_request.item_id)
-        self.item_service.check_stock.assert_called_once_with(
-            add_to_cart_request.item_id, quantity=2
-        )
-        self.user_repository.save.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_execute_item_already_in_cart(self, add_to_cart_request):
+        self.user_repository.add_cart_item.assert_called_once()
+        assert user.cart_items == []
+
+    @pytest.mark.parametrize(
+        ("user_exists", "item_found", "in_stock", "in_cart", "error", "message"),
+        [
+            pytest.param(
+                False,
+                True,
+                True,
+                False,
+                UserNotFoundError,
+                "User does not exists",
+                id="user_not_found",
+            ),
+            pytest.param(
+                True,
+                False,
+                False,
+                False,
+                ItemNotFoundError,
+                "Item does not exists",
+                id="item_not_found",
+            ),
+            pytest.param(
+                True,
+                True,
+                False,
+                False,
+                InsufficientStockError,
+                "Not enough items in stock",
+                id="insufficient_stock",
+            ),
+            pytest.param(
+                True,
+                True,
+                True,
+                True,
+                ItemAlreadyInCartError,
+                "Item already in cart",
+                id="item_already_in_cart",
+            ),
+        ],
+    )
+    async def test_execute_rejected(
+        self,
+        add_to_cart_request,
+        make_user,
+        make_cart_item,
+        user_exists,
+        item_found,
+        in_stock,
+        in_cart,
+        error,
+        message,
+    ):
         # Arrange
         user_id = uuid4()
-        cart_item = CartItem(
-            user_id=user_id, item_id=add_to_cart_request.item_id, quantity=1
+        cart_items = (
+            [
+                make_cart_item(
+                    user_id=user_id, item_id=add_to_cart_request.item_id, quantity=1
+                )
+            ]
+            if in_cart
+            else []
         )
-        user = User(
-            id=user_id,
-            first_name="John",
-            last_name="Doe",
-            email="john.doe@example.com",
-            hashed_password="hashed_password",
-            shipping_address=None,
-            cart_items=[cart_item],
+        user = make_user(id=user_id, cart_items=cart_items) if user_exists else None
+        item = (
+            {"id": add_to_cart_request.item_id, "name": "Test Item", "quantity": 5}
+            if item_found
+            else None
         )
-        item = {"id": add_to_cart_request.item_id, "name": "Test Item", "quantity": 5}
         self.user_repository.find_by_id.return_value = user
-        self.item_service.get_item.return_value = item
-        self.item_service.check_stock.return_value = True
+        self.item_service.get_item_with_stock.return_value = (item, in_stock)
 
         # Act/Assert
-        with pytest.raises(ValueError) as exc:
+        with pytest.raises(error, match=f"^{message}$"):
             await self.use_case.execute(user_id, add_to_cart_request)
-        assert str(exc.value) == "Item already in cart"
         self.user_repository.find_by_id.assert_called_once_with(user_id)
-        self.item_service.get_item.assert_called_once_with(add_to_cart_request.item_id)
-        self.item_service.check_stock.assert_called_once_with(
+        self.item_service.get_item_with_stock.assert_called_once_with(
             add_to_cart_request.item_id, quantity=2
         )
+        self.user_repository.add_cart_item.assert_not_called()
         self.user_repository.save.assert_not_called()
 
 
@@ -233,10 +216,10 @@ class TestListItemsInCartUseCase:
         self.user_repository = mock_user_repository
         self.use_case = ListItemsInCartUseCase(self.user_repository)
 
-    def test_execute_success(self):
+    def test_execute_success(self, make_cart_item):
         # Arrange
         user_id = uuid4()
-        cart_item = CartItem(user_id=user_id, item_id=uuid4(), quantity=2)
+        cart_item = make_cart_item(user_id=user_id)
         self.user_repository.find_cart_items.return_value = [cart_item]
 
         # Act